@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for RSS item field extraction.
+Compares the original per-field re.search implementation with ListingParser
+on a synthetic astalegale feed and reports items/second for both.
+"""
+
+import argparse
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixtures import build_feed  # noqa: E402
+from scraper import Auction, ListingParser  # noqa: E402
+
+
+def legacy_parse(item: ET.Element) -> Optional[Auction]:
+    """The per-field re.search implementation ListingParser replaced"""
+    title_elem = item.find("title")
+    desc_elem = item.find("description")
+    link_elem = item.find("link")
+    if title_elem is None or desc_elem is None or link_elem is None:
+        return None
+
+    title = title_elem.text or ""
+    description = desc_elem.text or ""
+    url = link_elem.text or ""
+
+    base_price = None
+    match = re.search(r"Prezzo:\s*([\d.,]+)\s*€", description)
+    if match:
+        try:
+            base_price = float(match.group(1).replace(".", "").replace(",", "."))
+        except ValueError:
+            pass
+
+    auction_date = None
+    match = re.search(r"Data asta:\s*(\d{2}/\d{2}/\d{4})", description)
+    if match:
+        try:
+            auction_date = datetime.strptime(match.group(1), "%d/%m/%Y")
+        except ValueError:
+            pass
+
+    match = re.search(r"Tipologia:\s*([^-]+)", description)
+    property_type = match.group(1).strip() if match else "Unknown"
+
+    address = title.split(" - Lotto")[0].strip()
+    match = re.search(r"Tribunale di ([^-]+)", title)
+    tribunal = f"Tribunale di {match.group(1).strip()}" if match else ""
+    match = re.search(r"Rif\. #(\w+)", title)
+    reference = match.group(1) if match else ""
+
+    desc_text = description.split(" - Tipologia:")[0].strip()
+
+    if base_price is None:
+        return None
+
+    return Auction(
+        title=title,
+        address=address,
+        description=desc_text,
+        tribunal=tribunal,
+        auction_date=auction_date,
+        base_price=base_price,
+        url=url,
+        reference=reference,
+        property_type=property_type,
+    )
+
+
+def current_parse(item: ET.Element, parser: ListingParser = ListingParser()) -> Optional[Auction]:
+    """Item parsing as done by AstaLegaleScraper._parse_rss_item"""
+    title_elem = item.find("title")
+    desc_elem = item.find("description")
+    link_elem = item.find("link")
+    if title_elem is None or desc_elem is None or link_elem is None:
+        return None
+    return parser.parse(title_elem.text or "", desc_elem.text or "", link_elem.text or "")
+
+
+def measure(parse, items: list[ET.Element], repeat: int) -> tuple[float, list]:
+    """Return the best items/second over several runs, with the parsed results"""
+    best = float("inf")
+    results: list = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [parse(item) for item in items]
+        best = min(best, time.perf_counter() - start)
+    return len(items) / best, results
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark RSS item parsing")
+    parser.add_argument("--items", type=int, default=100_000, help="Number of synthetic items (default: 100000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation, best is kept (default: 3)")
+    args = parser.parse_args()
+
+    items = ET.fromstring(build_feed(args.items)).findall(".//item")
+    before, legacy = measure(legacy_parse, items, args.repeat)
+    after, current = measure(current_parse, items, args.repeat)
+
+    if legacy != current:
+        print("ERROR: ListingParser results differ from the legacy implementation", file=sys.stderr)
+        return 1
+
+    print(f"items:  {len(items)}")
+    print(f"before: {before:,.0f} items/s (per-field re.search)")
+    print(f"after:  {after:,.0f} items/s (ListingParser)")
+    print(f"speedup: {after / before:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
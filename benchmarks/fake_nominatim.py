@@ -0,0 +1,65 @@
+"""
+Local fake Nominatim server for geocoding benchmarks.
+Answers /search with a deterministic suburb per street after a configurable latency.
+"""
+
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+SUBURBS = ["Centro", "San Salvario", "Crocetta", "Cit Turin", "Vanchiglia", "Aurora", "San Donato", "Lingotto"]
+
+
+class FakeNominatimServer:
+    """Threaded HTTP server mimicking the Nominatim search API"""
+
+    def __init__(self, latency: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/search"
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                params = parse_qs(urlsplit(self.path).query)
+                query = (params.get("q") or params.get("street") or [""])[0]
+                street = query.split(",")[0].rstrip("0123456789 ")
+                suburb = SUBURBS[zlib.crc32(street.encode("utf-8")) % len(SUBURBS)]
+                body = json.dumps([{"lat": "45.07", "lon": "7.68", "address": {"suburb": suburb}}]).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def __enter__(self) -> "FakeNominatimServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,99 @@
+"""
+Synthetic astalegale RSS fixtures for benchmarks.
+Titles and descriptions follow the formats ListingParser expects.
+"""
+
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator, Optional
+
+STREETS = [
+    "Via Roma", "Corso Francia", "Via Nizza", "Corso Vittorio Emanuele II", "Via Po",
+    "C.so Regina Margherita", "Via Madama Cristina", "P.zza Castello", "Via Garibaldi",
+    "Corso Giulio Cesare", "Via Cibrario", "C.so Unione Sovietica", "Via Sacchi",
+]
+PROPERTY_TYPES = ["Abitazione di tipo civile", "Abitazione di tipo economico", "Box auto", "Magazzino"]
+TRIBUNALS = ["Torino", "Ivrea", "Asti"]
+
+FEED_HEADER = '<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel><title>Astalegale</title>'
+FEED_FOOTER = "</channel></rss>"
+
+
+def iter_items(count: int, seed: int = 42, now: Optional[datetime] = None) -> Iterator[str]:
+    """Yield serialized <item> elements with a realistic mix of prices, dates and formats"""
+    rng = random.Random(seed)
+    now = now or datetime.now()
+    for i in range(count):
+        address = f"{rng.choice(STREETS)} {rng.randint(1, 200)}"
+        description = f"Appartamento al piano {rng.randint(0, 8)} - Tipologia: {rng.choice(PROPERTY_TYPES)}"
+        # A few listings have no price (dropped by the parser) or no scheduled date
+        if rng.random() < 0.98:
+            description += f" - Prezzo: {rng.randint(15, 450)}.{rng.randint(0, 999):03d},00 €"
+        if rng.random() < 0.9:
+            date = now + timedelta(days=rng.randint(-60, 240))
+            description += f" - Data asta: {date.strftime('%d/%m/%Y')} - {rng.randint(9, 16):02d}:00"
+        yield (
+            "<item>"
+            f"<title>{address} - Lotto {rng.randint(1, 9)} - Tribunale di {rng.choice(TRIBUNALS)}"
+            f" - Rif. #{100000 + i}</title>"
+            f"<description>{description}</description>"
+            f"<link>https://www.astalegale.net/Aste/Detail/{100000 + i}</link>"
+            "</item>"
+        )
+
+
+def iter_feed(count: int, seed: int = 42, chunk_items: int = 1000) -> Iterator[bytes]:
+    """Yield a synthetic RSS feed in chunks, so feeds of 1M items never sit in memory whole"""
+    chunk = [FEED_HEADER]
+    for item in iter_items(count, seed):
+        chunk.append(item)
+        if len(chunk) >= chunk_items:
+            yield "".join(chunk).encode("utf-8")
+            chunk = []
+    chunk.append(FEED_FOOTER)
+    yield "".join(chunk).encode("utf-8")
+
+
+def build_feed(count: int, seed: int = 42) -> bytes:
+    """Build a whole synthetic RSS feed in memory"""
+    return b"".join(iter_feed(count, seed))
+
+
+def addresses(count: int, seed: int = 42) -> list[str]:
+    """Return synthetic addresses on distinct streets, so each needs its own geocoding request"""
+    rng = random.Random(seed)
+    result = []
+    for i in range(count):
+        # Geocoding is keyed per street, so the street name itself must differ
+        # (the "x" keeps prefixes from reading as abbreviations such as "S" for "San")
+        prefix = ""
+        while True:
+            i, letter = divmod(i, 26)
+            prefix = chr(ord("a") + letter) + prefix
+            if i == 0:
+                break
+        result.append(f"{prefix.title()}x {rng.choice(STREETS)} {rng.randint(1, 200)}")
+    return result
+
+
+def write_feed(path: Path, count: int, seed: int = 42) -> int:
+    """Write a synthetic RSS feed to a file and return its size in bytes"""
+    size = 0
+    with open(path, "wb") as f:
+        for chunk in iter_feed(count, seed):
+            f.write(chunk)
+            size += len(chunk)
+    return size
+
+
+class FeedResponse:
+    """Minimal stand-in for a streamed requests.Response reading a feed file"""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        with open(self.path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
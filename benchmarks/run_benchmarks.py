@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the scrape pipeline.
+Measures parse, filter (per item and, with numpy, columnar) and CSV write throughput on synthetic feeds of
+configurable size, geocoding throughput against a local fake Nominatim with
+a mocked rate limit, and peak RSS memory. Results are written as JSON so
+runs can be compared over time.
+"""
+
+import argparse
+import importlib.util
+import json
+import logging
+import multiprocessing
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_nominatim import FakeNominatimServer  # noqa: E402
+from fixtures import FeedResponse, addresses, build_feed, write_feed  # noqa: E402
+from scraper import AstaLegaleScraper, AuctionTable, FilterProfile, GeocodingService, JsonGeocodeCache, ListingParser, NominatimBackend  # noqa: E402
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of the current process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def throughput(count: int, seconds: float) -> dict:
+    """Timing entry for one stage"""
+    return {
+        "items": count,
+        "seconds": round(seconds, 4),
+        "items_per_second": round(count / seconds, 1) if seconds else None,
+    }
+
+
+def bench_pipeline(count: int, seed: int) -> dict:
+    """Run parse, filter and CSV stages on a synthetic feed (in a fresh process for a clean peak RSS)"""
+    logging.getLogger().setLevel(logging.WARNING)
+    baseline_rss = peak_rss_mb()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        feed_file = Path(tmp) / "feed.xml"
+        feed_bytes = write_feed(feed_file, count, seed)
+        geocoder = GeocodingService(cache=JsonGeocodeCache(str(Path(tmp) / "geocode.json")))
+        scraper = AstaLegaleScraper(max_budget=150000, months_ahead=6, geocoder=geocoder)
+        try:
+            response = FeedResponse(feed_file)
+            start = time.perf_counter()
+            auctions = [
+                auction
+                for auction in map(scraper._parse_rss_item, scraper._iter_feed_items(response))
+                if auction is not None
+            ]
+            parse = throughput(count, time.perf_counter() - start)
+            parse["bytes"] = feed_bytes
+            parse["megabytes_per_second"] = round(feed_bytes / (1024 * 1024) / parse["seconds"], 1)
+
+            now = datetime.now()
+            start = time.perf_counter()
+            matched = [auction for auction in auctions if scraper._passes_filters(auction, now)]
+            filtering = throughput(len(auctions), time.perf_counter() - start)
+            filtering["matched"] = len(matched)
+
+            table_filter = None
+            if importlib.util.find_spec("numpy") is not None:
+                profile = FilterProfile(max_budget=150000, months_ahead=6)
+                table = AuctionTable(auctions)
+                start = time.perf_counter()
+                selected = profile.apply(table, now)
+                table_filter = throughput(len(auctions), time.perf_counter() - start)
+                table_filter["matched"] = len(selected)
+
+            start = time.perf_counter()
+            scraper.save_results(auctions, str(Path(tmp) / "auctions.csv"))
+            csv_write = throughput(len(auctions), time.perf_counter() - start)
+            csv_write["bytes"] = (Path(tmp) / "auctions.csv").stat().st_size
+        finally:
+            scraper.close()
+
+    return {
+        "items": count,
+        "parse": parse,
+        "filter": filtering,
+        "table_filter": table_filter,
+        "csv_write": csv_write,
+        "baseline_rss_mb": round(baseline_rss, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def bench_memory(count: int, seed: int) -> dict:
+    """Memory held by parsed auctions, as objects and (with numpy) as an AuctionTable, scaled to 100k"""
+    texts = [
+        (item.findtext("title") or "", item.findtext("description") or "", item.findtext("link") or "")
+        for item in ET.fromstring(build_feed(count, seed)).iter("item")
+    ]
+    parser = ListingParser()
+    has_numpy = importlib.util.find_spec("numpy") is not None
+    if has_numpy:
+        # Import numpy up front so its module allocations are not counted as table memory
+        AuctionTable()
+
+    # Only what the auctions keep alive is counted: the feed texts already exist
+    tracemalloc.start()
+    auctions = [auction for auction in (parser.parse(*text) for text in texts) if auction is not None]
+    objects = tracemalloc.get_traced_memory()[0]
+    table = AuctionTable(auctions) if has_numpy else None
+    table_bytes = tracemalloc.get_traced_memory()[0] - objects if table is not None else None
+    tracemalloc.stop()
+
+    per_100k = 100_000 / len(auctions)
+    return {
+        "items": len(auctions),
+        "auction_bytes": round(objects / len(auctions), 1),
+        "auction_mb_per_100k": round(objects * per_100k / (1024 * 1024), 1),
+        "table_mb_per_100k": round(table_bytes * per_100k / (1024 * 1024), 1) if table is not None else None,
+    }
+
+
+def bench_geocoding(count: int, rate: float, latency: float, workers: int) -> dict:
+    """Geocode distinct addresses against the fake Nominatim under a mocked rate limit (0 for none, like a self-hosted instance)"""
+    with FakeNominatimServer(latency=latency) as server, tempfile.TemporaryDirectory() as tmp:
+        geocoder = GeocodingService(
+            cache=JsonGeocodeCache(str(Path(tmp) / "geocode.json")),
+            backend=NominatimBackend(server.url, rate=rate or None, max_workers=workers),
+        )
+        try:
+            start = time.perf_counter()
+            futures = [geocoder.submit(address, "torino") for address in addresses(count)]
+            for future in futures:
+                future.result()
+            result = throughput(count, time.perf_counter() - start)
+        finally:
+            geocoder.close()
+
+    result.update({
+        "rate_limit": rate,
+        "latency": latency,
+        "workers": workers,
+        "requests": server.requests,
+        "rate_limit_floor_seconds": round((count - 1) / rate, 4) if rate else None,
+    })
+    return result
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Run the scraper benchmark suite")
+    parser.add_argument("--items", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="Feed sizes to benchmark (default: 1000 10000 100000)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the synthetic feeds (default: 42)")
+    parser.add_argument("--memory-items", type=int, default=100_000, help="Auctions parsed for the memory footprint measurement (default: 100000)")
+    parser.add_argument("--geocode-addresses", type=int, default=200, help="Distinct addresses to geocode (default: 200)")
+    parser.add_argument("--geocode-rate", type=float, default=100.0, help="Mocked geocoding rate limit in requests/second, 0 for none (default: 100)")
+    parser.add_argument("--geocode-latency", type=float, default=0.02, help="Fake Nominatim response latency in seconds (default: 0.02)")
+    parser.add_argument("--geocode-workers", type=int, default=2, help="Geocoding worker threads (default: 2)")
+    parser.add_argument("--output", type=str, default="benchmark_results.json", help="Output JSON file (default: benchmark_results.json)")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pipeline": [],
+    }
+
+    context = multiprocessing.get_context("spawn")
+    for count in args.items:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            result = executor.submit(bench_pipeline, count, args.seed).result()
+        results["pipeline"].append(result)
+        print(
+            f"{count:>9} items | parse {result['parse']['items_per_second']:>10,.0f}/s"
+            f" | filter {result['filter']['items_per_second']:>12,.0f}/s"
+            + (f" (columnar {result['table_filter']['items_per_second']:>12,.0f}/s)" if result["table_filter"] else "")
+            + f" | csv {result['csv_write']['items_per_second']:>10,.0f}/s"
+            f" | peak RSS {result['peak_rss_mb']:>7,.1f} MB"
+        )
+
+    results["memory"] = bench_memory(args.memory_items, args.seed)
+    print(
+        f"memory: {results['memory']['auction_mb_per_100k']:.1f} MB per 100k auctions"
+        f" ({results['memory']['auction_bytes']:.0f} bytes each)"
+        + (f", {results['memory']['table_mb_per_100k']:.1f} MB as an AuctionTable" if results["memory"]["table_mb_per_100k"] is not None else "")
+    )
+
+    results["geocode"] = bench_geocoding(args.geocode_addresses, args.geocode_rate, args.geocode_latency, args.geocode_workers)
+    print(
+        f"geocoding: {results['geocode']['items']} addresses in {results['geocode']['seconds']:.2f}s"
+        f" ({results['geocode']['items_per_second']:,.1f}/s with {args.geocode_workers} workers, "
+        + (f"{args.geocode_rate:g}/s limit)" if args.geocode_rate else "no rate limit)")
+    )
+
+    Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"Results saved to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
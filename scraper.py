@@ -9,16 +9,32 @@ Uses OpenStreetMap Nominatim API for zone/neighborhood detection.
 """
 
 import argparse
+import bisect
 import csv
+import hashlib
+import importlib.util
 import json
 import logging
+import os
+import queue
+import random
 import re
+import signal
+import sqlite3
+import sys
+import tempfile
+import threading
 import time
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional, TextIO, Union
+from urllib.parse import parse_qs, urlsplit
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -31,102 +47,1491 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class _InternedField:
+    """Slot-backed string attribute keeping one shared copy of each distinct value"""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance, self.slot)
+
+    def __set__(self, instance, value: str) -> None:
+        setattr(instance, self.slot, sys.intern(value))
+
+
 class Auction:
-    """Represents an auction listing"""
-    title: str
-    address: str
-    zone: str = ""
-    description: str = ""
-    tribunal: str = ""
-    auction_date: Optional[datetime] = None
-    base_price: float = 0.0
-    url: str = ""
-    reference: str = ""
-    property_type: str = "Unknown"
+    """Represents an auction listing
 
+    Slotted, with the low-cardinality fields (zone, tribunal, property type and
+    city) interned and the auction date held as a day ordinal, so large
+    histories stay compact. Dates are calendar days exposed as midnight datetimes.
+    """
 
-class GeocodingService:
-    """Service to detect neighborhood/zone from address using OpenStreetMap Nominatim"""
+    __slots__ = ("title", "address", "_zone", "description", "_tribunal", "_date", "base_price", "url", "reference", "_property_type", "_city")
+    FIELDS = ("title", "address", "zone", "description", "tribunal", "auction_date", "base_price", "url", "reference", "property_type", "city")
+
+    zone = _InternedField()
+    tribunal = _InternedField()
+    property_type = _InternedField()
+    city = _InternedField()
+
+    def __init__(
+        self,
+        title: str,
+        address: str,
+        zone: str = "",
+        description: str = "",
+        tribunal: str = "",
+        auction_date: Optional[datetime] = None,
+        base_price: float = 0.0,
+        url: str = "",
+        reference: str = "",
+        property_type: str = "Unknown",
+        city: str = "",
+    ):
+        self.title = title
+        self.address = address
+        self.zone = zone
+        self.description = description
+        self.tribunal = tribunal
+        self.auction_date = auction_date
+        self.base_price = base_price
+        self.url = url
+        self.reference = reference
+        self.property_type = property_type
+        self.city = city
+
+    @property
+    def auction_date(self) -> Optional[datetime]:
+        """Auction day as a midnight datetime, or None when not scheduled"""
+        return datetime.fromordinal(self._date) if self._date else None
+
+    @auction_date.setter
+    def auction_date(self, value: Optional[datetime]) -> None:
+        self._date = value.toordinal() if value is not None else 0
+
+    def _values(self) -> tuple:
+        """Field values in FIELDS order"""
+        return tuple(getattr(self, name) for name in self.FIELDS)
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in zip(self.FIELDS, self._values()))
+        return f"Auction({fields})"
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict with an ISO auction date"""
+        data = dict(zip(self.FIELDS, self._values()))
+        data["auction_date"] = self.auction_date.isoformat() if self.auction_date else None
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Auction":
+        """Rebuild an Auction from the output of to_dict"""
+        data = dict(data)
+        if data.get("auction_date"):
+            data["auction_date"] = datetime.fromisoformat(data["auction_date"])
+        return cls(**data)
+
+
+def _atomic_write_text(path: Path, data: str) -> None:
+    """Write a text file via a temporary file and rename, so readers never see a partial file"""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class ScrapeMetrics:
+    """Per-stage wall time, item counts and event counters for one scrape run"""
+
+    STAGE_FIELDS = ("seconds", "items_in", "items_out")
+
+    def __init__(self):
+        self.started = datetime.now()
+        self._start = time.perf_counter()
+        self.stages: dict[str, dict[str, float]] = {}
+        self.counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float = 0.0, items_in: int = 0, items_out: int = 0) -> None:
+        """Add time and item counts to a stage (summed across concurrent feeds)"""
+        with self._lock:
+            totals = self.stages.setdefault(stage, dict.fromkeys(self.STAGE_FIELDS, 0))
+            totals["seconds"] += seconds
+            totals["items_in"] += items_in
+            totals["items_out"] += items_out
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """Time a block of code as part of a stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def incr(self, counter: str, amount: int = 1) -> None:
+        """Increment an event counter"""
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def record_retries(self, response: requests.Response) -> None:
+        """Count the retries the urllib3 Retry adapter performed for a response"""
+        retries = getattr(response.raw, "retries", None)
+        if retries is not None and retries.history:
+            self.incr("http_retries", len(retries.history))
+
+    def to_dict(self) -> dict:
+        """JSON run report"""
+        with self._lock:
+            return {
+                "started": self.started.isoformat(timespec="seconds"),
+                "duration_seconds": round(time.perf_counter() - self._start, 6),
+                "stages": {
+                    name: {**totals, "seconds": round(totals["seconds"], 6)}
+                    for name, totals in self.stages.items()
+                },
+                "counters": dict(self.counters),
+            }
+
+    def to_prometheus(self, prefix: str = "auction_scraper") -> str:
+        """Prometheus text exposition format"""
+        report = self.to_dict()
+        lines = [
+            f"# HELP {prefix}_run_duration_seconds Wall time of the whole run",
+            f"# TYPE {prefix}_run_duration_seconds gauge",
+            f"{prefix}_run_duration_seconds {report['duration_seconds']}",
+        ]
+        for field, help_text in (
+            ("seconds", "Wall time spent in each pipeline stage"),
+            ("items_in", "Items entering each pipeline stage"),
+            ("items_out", "Items leaving each pipeline stage"),
+        ):
+            metric = f"{prefix}_stage_{field}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} gauge")
+            for name, totals in report["stages"].items():
+                lines.append(f'{metric}{{stage="{name}"}} {totals[field]}')
+        for name, value in report["counters"].items():
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting how often an API may be called"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("Rate must be a positive value")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available and consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class GeocodeCache(ABC):
+    """Interface for geocode cache backends keyed by (address, city)"""
+
+    @abstractmethod
+    def get(self, address: str, city: str) -> Optional[str]:
+        """Return the cached zone ("" for a known miss), or None if not cached"""
+
+    @abstractmethod
+    def set(self, address: str, city: str, zone: str) -> None:
+        """Record the zone found for an address ("" for a miss)"""
+
+    @abstractmethod
+    def street_zones(self, street: str, city: str) -> dict[str, int]:
+        """Count the resolved entries of a normalized street by zone"""
+
+    def flush(self) -> None:
+        """Persist pending entries, if the backend buffers writes"""
+
+    def close(self) -> None:
+        """Flush and release the backend"""
+        self.flush()
+
+
+class JsonGeocodeCache(GeocodeCache):
+    """Geocode cache held in memory and persisted as a JSON file in batches"""
+
+    # Misses are stored under this key with the time they were recorded; cache keys always contain "|"
+    MISSES_KEY = "_misses"
+
+    def __init__(
+        self,
+        cache_file: str = ".geocode_cache.json",
+        flush_every: int = 50,
+        flush_interval: float = 30.0,
+        negative_ttl: float = 7 * 24 * 3600,
+    ):
+        self.cache_file = Path(cache_file)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.negative_ttl = negative_ttl
+        self.misses: dict[str, float] = {}
+        self.cache: dict[str, str] = self._load_cache()
+        self.normalizer = AddressNormalizer()
+        # Street → zone counts, built on the first gazetteer lookup and kept up to date afterwards
+        self._streets: Optional[dict[str, dict[str, int]]] = None
+        self._cache_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._dirty = 0
+        self._last_flush = time.monotonic()
+
+    def _load_cache(self) -> dict[str, str]:
+        """Load cache from file if it exists"""
+        if self.cache_file.exists():
+            try:
+                entries = json.loads(self.cache_file.read_text(encoding="utf-8"))
+                now = time.time()
+                self.misses = {
+                    key: updated_at
+                    for key, updated_at in entries.pop(self.MISSES_KEY, {}).items()
+                    if now - updated_at <= self.negative_ttl
+                }
+                # Older files stored misses as empty zones without a timestamp: retry those
+                return {key: zone for key, zone in entries.items() if zone}
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Ignoring unreadable geocode cache {self.cache_file}: {e}")
+        return {}
+
+    def _save_cache(self) -> None:
+        """Save cache to file atomically via a temporary file and rename"""
+        with self._cache_lock:
+            data = json.dumps({**self.cache, self.MISSES_KEY: self.misses}, ensure_ascii=False)
+            self._dirty = 0
+            self._last_flush = time.monotonic()
+
+        try:
+            _atomic_write_text(self.cache_file, data)
+        except OSError as e:
+            logger.warning(f"Failed to save geocode cache: {e}")
+
+    def flush(self) -> None:
+        """Persist pending cache entries, if any"""
+        with self._flush_lock:
+            if self._dirty:
+                self._save_cache()
+
+    def get(self, address: str, city: str) -> Optional[str]:
+        key = f"{address}|{city}"
+        zone = self.cache.get(key)
+        if zone is None:
+            updated_at = self.misses.get(key)
+            if updated_at is not None and time.time() - updated_at <= self.negative_ttl:
+                return ""
+        return zone
+
+    def street_zones(self, street: str, city: str) -> dict[str, int]:
+        with self._cache_lock:
+            if self._streets is None:
+                # The whole file is in memory already: index it once, on first use
+                self._streets = {}
+                for key, zone in self.cache.items():
+                    self._count_street(key, zone, 1)
+            return dict(self._streets.get(f"{street}|{city}", {}))
+
+    def _count_street(self, key: str, zone: str, delta: int) -> None:
+        """Add or remove one entry from the street index (caller holds the cache lock)"""
+        if not zone:
+            return
+        address, _, city = key.rpartition("|")
+        zones = self._streets.setdefault(f"{self.normalizer.street_key(address)}|{city}", {})
+        zones[zone] = zones.get(zone, 0) + delta
+        if not zones[zone]:
+            del zones[zone]
 
-    NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+    def set(self, address: str, city: str, zone: str) -> None:
+        """Record a lookup result, flushing to disk every N entries or T seconds"""
+        key = f"{address}|{city}"
+        with self._cache_lock:
+            if zone:
+                if self._streets is not None:
+                    self._count_street(key, self.cache.get(key, ""), -1)
+                    self._count_street(key, zone, 1)
+                self.cache[key] = zone
+                self.misses.pop(key, None)
+            else:
+                self.misses[key] = time.time()
+            self._dirty += 1
+            due = self._dirty >= self.flush_every or (
+                self._dirty and time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        if due:
+            self.flush()
+
+
+class SqliteGeocodeCache(GeocodeCache):
+    """Geocode cache in a SQLite file, read lazily per key and safe to share between processes"""
 
-    def __init__(self, cache_file: str = ".geocode_cache.json"):
+    def __init__(self, cache_file: str = ".geocode_cache.sqlite", negative_ttl: float = 7 * 24 * 3600):
         self.cache_file = Path(cache_file)
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.cache_file, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self.normalizer = AddressNormalizer()
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS geocode (
+                address TEXT NOT NULL,
+                city TEXT NOT NULL,
+                zone TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                street TEXT,
+                PRIMARY KEY (address, city)
+            )
+            """
+        )
+        self._add_street_column()
+        self._conn.execute("CREATE INDEX IF NOT EXISTS geocode_street ON geocode (street, city)")
+
+    def _add_street_column(self) -> None:
+        """Add and fill the normalized street column of a cache created before it existed (once)"""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(geocode)")}
+            if "street" not in columns:
+                self._conn.execute("ALTER TABLE geocode ADD COLUMN street TEXT")
+                rows = self._conn.execute("SELECT address, city FROM geocode").fetchall()
+                self._conn.executemany(
+                    "UPDATE geocode SET street = ? WHERE address = ? AND city = ?",
+                    ((self.normalizer.street_key(address), address, city) for address, city in rows),
+                )
+                logger.info(f"Added normalized streets to {len(rows)} geocode cache entries")
+            self._conn.execute("COMMIT")
+        except sqlite3.Error:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def get(self, address: str, city: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT zone, updated_at FROM geocode WHERE address = ? AND city = ?",
+                (address, city),
+            ).fetchone()
+        if row is None:
+            return None
+        zone, updated_at = row
+        if not zone and time.time() - updated_at > self.negative_ttl:
+            return None
+        return zone
+
+    def set(self, address: str, city: str, zone: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geocode (address, city, zone, updated_at, street) VALUES (?, ?, ?, ?, ?)",
+                (address, city, zone, time.time(), self.normalizer.street_key(address)),
+            )
+
+    def street_zones(self, street: str, city: str) -> dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT zone, COUNT(*) FROM geocode WHERE street = ? AND city = ? AND zone != '' GROUP BY zone",
+                (street, city),
+            ).fetchall()
+        return dict(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_geocode_cache(cache_file: str) -> GeocodeCache:
+    """Open the cache backend matching the file extension (.sqlite/.db or JSON)"""
+    if Path(cache_file).suffix in (".sqlite", ".sqlite3", ".db"):
+        return SqliteGeocodeCache(cache_file)
+    return JsonGeocodeCache(cache_file)
+
+
+@dataclass(frozen=True)
+class NormalizedAddress:
+    """Canonical street name (lowercase, abbreviations expanded) and house number"""
+    street: str
+    number: str = ""
+
+
+class AddressNormalizer:
+    """Reduces address spellings to a canonical street so variants share one geocoding key"""
+
+    # Keys are lowercase abbreviations with dots removed
+    ABBREVIATIONS = {
+        "v": "via",
+        "vle": "viale",
+        "cso": "corso",
+        "c": "corso",
+        "pza": "piazza",
+        "pzza": "piazza",
+        "pzz": "piazza",
+        "p": "piazza",
+        "ple": "piazzale",
+        "pzle": "piazzale",
+        "lgo": "largo",
+        "l": "largo",
+        "str": "strada",
+        "vic": "vicolo",
+        "vco": "vicolo",
+        "bgo": "borgo",
+        "fraz": "frazione",
+        "loc": "località",
+        "reg": "regione",
+        "lungot": "lungotevere",
+        "s": "san",
+        "ss": "santi",
+    }
+    # Abbreviations that are only expanded as the first word, where they name the street type
+    STREET_TYPE_ONLY = {"v", "c", "p", "l"}
+    SEPARATOR_PATTERN = re.compile(r"[,;:()\"']+|\s+-\s+")
+    DOTTED_PATTERN = re.compile(r"(?<=\w)\.(?=\w)")
+    NUMBER_PATTERN = re.compile(r"\s+(?:(?:n|nr|num|civ)\.?\s*)?(\d+(?:\s*(?:bis|ter|quater)\b|\s*[/-]\s*\w+|\s?[a-z]\b)?|snc|sn)\s*$")
+
+    def normalize(self, address: str) -> NormalizedAddress:
+        """Split an address into its canonical street and house number"""
+        text = self.SEPARATOR_PATTERN.sub(" ", address.casefold())
+        # "c.so" -> "cso": drop dots inside abbreviations before splitting into words
+        text = self.DOTTED_PATTERN.sub("", text)
+        text = " ".join(text.split())
+
+        number = ""
+        match = self.NUMBER_PATTERN.search(text)
+        if match:
+            number = re.sub(r"\s+", "", match.group(1))
+            text = text[:match.start()]
+
+        words = []
+        for i, word in enumerate(text.split()):
+            bare = word.strip(".")
+            expansion = self.ABBREVIATIONS.get(bare)
+            if expansion and (i == 0 or bare not in self.STREET_TYPE_ONLY):
+                word = expansion
+            words.append(word.strip("."))
+        street = " ".join(word for word in words if word)
+        return NormalizedAddress(street or address.strip().casefold(), number)
+
+    def street_key(self, address: str) -> str:
+        """Canonical street-level key of an address (no house number)"""
+        return self.normalize(address).street
+
+
+class StreetGazetteer:
+    """Normalized street → zone counts read from the geocode cache one street at a time, to resolve known streets locally"""
+
+    MIN_CONFIDENCE = 0.8
+    # A share computed over fewer cached addresses says nothing about how a street splits
+    MIN_OBSERVATIONS = 2
+
+    def __init__(
+        self,
+        cache: GeocodeCache,
+        min_confidence: float = MIN_CONFIDENCE,
+        min_observations: int = MIN_OBSERVATIONS,
+        normalizer: Optional[AddressNormalizer] = None,
+    ):
+        self.cache = cache
+        self.min_confidence = min_confidence
+        self.min_observations = min_observations
+        self.normalizer = normalizer if normalizer is not None else AddressNormalizer()
+        self.streets: dict[str, dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, address: str, city: str, zone: str) -> None:
+        """Count one newly geocoded address (street or house level) towards its street"""
+        if not zone:
+            return
+        key = f"{self.normalizer.street_key(address)}|{city}"
+        with self._lock:
+            # Streets not loaded yet will read the new entry from the cache
+            zones = self.streets.get(key)
+            if zones is not None:
+                zones[zone] = zones.get(zone, 0) + 1
+
+    def lookup(self, street: str, city: str) -> Optional[tuple[str, float]]:
+        """Dominant zone of a normalized street and the share of its observations in that zone"""
+        key = f"{street}|{city}"
+        with self._lock:
+            zones = self.streets.get(key)
+            if zones is None:
+                zones = self.streets[key] = self.cache.street_zones(street, city)
+            total = sum(zones.values())
+            if total < self.min_observations:
+                return None
+            zone, count = max(zones.items(), key=lambda item: item[1])
+            return zone, count / total
+
+
+class ZoneIndex:
+    """Offline point-in-polygon zone lookup over neighborhood polygons, with a uniform grid index"""
+
+    NAME_PROPERTIES = ("name", "nome", "quartiere", "suburb", "zone", "zona")
+    GRID_SIZE = 64
+
+    def __init__(self, zones: list[tuple[str, list[list[list[tuple[float, float]]]]]]):
+        # Each zone is a name and a list of polygons; a polygon is its outer ring then its holes, in (lon, lat)
+        self.names: list[str] = []
+        self.polygons: list[list[list[tuple[float, float]]]] = []
+        self.bboxes: list[tuple[float, float, float, float]] = []
+        for name, polygons in zones:
+            for rings in polygons:
+                lons = [point[0] for point in rings[0]]
+                lats = [point[1] for point in rings[0]]
+                self.names.append(name)
+                self.polygons.append(rings)
+                self.bboxes.append((min(lons), min(lats), max(lons), max(lats)))
+
+        if self.bboxes:
+            self.min_lon = min(box[0] for box in self.bboxes)
+            self.min_lat = min(box[1] for box in self.bboxes)
+            self.cell_lon = (max(box[2] for box in self.bboxes) - self.min_lon) / self.GRID_SIZE or 1.0
+            self.cell_lat = (max(box[3] for box in self.bboxes) - self.min_lat) / self.GRID_SIZE or 1.0
+        self.grid: dict[tuple[int, int], list[int]] = {}
+        for i, (west, south, east, north) in enumerate(self.bboxes):
+            x0, y0 = self._cell(west, south)
+            x1, y1 = self._cell(east, north)
+            for x in range(x0, x1 + 1):
+                for y in range(y0, y1 + 1):
+                    self.grid.setdefault((x, y), []).append(i)
+
+    @classmethod
+    def from_geojson(cls, path: str, name_property: Optional[str] = None) -> "ZoneIndex":
+        """Load Polygon and MultiPolygon features, named by a property (e.g. 'name')"""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        zones = []
+        for feature in data.get("features", []):
+            geometry = feature.get("geometry") or {}
+            properties = feature.get("properties") or {}
+            keys = [name_property] if name_property else cls.NAME_PROPERTIES
+            name = next((str(properties[key]) for key in keys if properties.get(key)), "")
+            if not name:
+                continue
+            if geometry.get("type") == "Polygon":
+                polygons = [geometry["coordinates"]]
+            elif geometry.get("type") == "MultiPolygon":
+                polygons = geometry["coordinates"]
+            else:
+                continue
+            zones.append((name, [[[(float(x), float(y)) for x, y, *_ in ring] for ring in rings] for rings in polygons]))
+        if not zones:
+            raise ValueError(f"No named Polygon or MultiPolygon features in {path}")
+        logger.info(f"Loaded {len(zones)} zones from {path}")
+        return cls(zones)
+
+    def _cell(self, lon: float, lat: float) -> tuple[int, int]:
+        """Grid cell containing a point, clamped to the grid"""
+        x = min(max(int((lon - self.min_lon) / self.cell_lon), 0), self.GRID_SIZE - 1)
+        y = min(max(int((lat - self.min_lat) / self.cell_lat), 0), self.GRID_SIZE - 1)
+        return x, y
+
+    @staticmethod
+    def _in_ring(lon: float, lat: float, ring: list[tuple[float, float]]) -> bool:
+        """Ray casting point-in-polygon test"""
+        inside = False
+        x1, y1 = ring[-1]
+        for x2, y2 in ring:
+            if (y1 > lat) != (y2 > lat) and lon < (x2 - x1) * (lat - y1) / (y2 - y1) + x1:
+                inside = not inside
+            x1, y1 = x2, y2
+        return inside
+
+    def lookup(self, lat: float, lon: float) -> str:
+        """Zone containing a point, or empty string if none does"""
+        if not self.bboxes:
+            return ""
+        for i in self.grid.get(self._cell(lon, lat), ()):
+            west, south, east, north = self.bboxes[i]
+            if not (west <= lon <= east and south <= lat <= north):
+                continue
+            outer, *holes = self.polygons[i]
+            if self._in_ring(lon, lat, outer) and not any(self._in_ring(lon, lat, hole) for hole in holes):
+                return self.names[i]
+        return ""
+
+
+@dataclass
+class GeocodeResult:
+    """Coordinates and zone returned by a geocoder backend"""
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+    zone: str = ""
+
+
+class GeocoderBackend(ABC):
+    """Interface for geocoding services: request parameters, response parsing and throughput limits"""
+
+    name = "base"
+    # Whether an empty answer is a real miss worth caching
+    CACHE_MISSES = True
+
+    def __init__(self, url: str = "", rate: Optional[float] = None, max_workers: int = 2):
+        self.url = url
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(rate) if rate else None
+
+    @abstractmethod
+    def queries(self, address: str, city: str) -> list[tuple[str, dict]]:
+        """Query strategies to try in order, as (strategy name, request parameters)"""
+
+    @abstractmethod
+    def parse(self, payload) -> Optional[GeocodeResult]:
+        """Extract the best result from a decoded JSON response, or None if there is none"""
+
+
+class NominatimBackend(GeocoderBackend):
+    """OpenStreetMap Nominatim, public (rate limited) or self-hosted
+
+    Addresses go through a cascade: a structured house number + street + city
+    query bounded to the city's viewbox, the same without the house number,
+    then the original address as free text.
+    """
+
+    name = "nominatim"
+    PUBLIC_URL = "https://nominatim.openstreetmap.org/search"
+    # Nominatim usage policy: at most 1 request per second, shared by every client of the public instance
+    PUBLIC_RATE_LIMITER = RateLimiter(rate=1.0)
+    ZONE_FIELDS = ("suburb", "neighbourhood", "quarter", "city_district")
+    # Bounding boxes (west,north,east,south) keeping structured queries inside the city
+    VIEWBOXES = {
+        "torino": "7.5778,45.1402,7.7733,45.0067",
+    }
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        rate: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        viewboxes: Optional[dict[str, str]] = None,
+    ):
+        public = url is None or url == self.PUBLIC_URL
+        super().__init__(url or self.PUBLIC_URL, rate, max_workers or (2 if public else 16))
+        if public and rate is None:
+            self.rate_limiter = self.PUBLIC_RATE_LIMITER
+        self.viewboxes = {**self.VIEWBOXES, **(viewboxes or {})}
+        self.normalizer = AddressNormalizer()
+
+    def queries(self, address: str, city: str) -> list[tuple[str, dict]]:
+        common = {"format": "json", "addressdetails": 1, "limit": 1, "countrycodes": "it"}
+        structured = {**common, "city": city, "country": "Italia"}
+        viewbox = self.viewboxes.get(city.lower())
+        if viewbox:
+            structured.update(viewbox=viewbox, bounded=1)
+
+        normalized = self.normalizer.normalize(address)
+        strategies = []
+        if normalized.number:
+            strategies.append(("structured", {**structured, "street": f"{normalized.number} {normalized.street}"}))
+        strategies.append(("structured_street", {**structured, "street": normalized.street}))
+        strategies.append(("free_text", {**common, "q": f"{address}, {city}, Italia"}))
+        return strategies
+
+    def parse(self, payload) -> Optional[GeocodeResult]:
+        if not payload:
+            return None
+        result = payload[0]
+        addr = result.get("address", {})
+        return GeocodeResult(
+            lat=float(result["lat"]) if "lat" in result else None,
+            lon=float(result["lon"]) if "lon" in result else None,
+            zone=next((addr[field] for field in self.ZONE_FIELDS if addr.get(field)), ""),
+        )
+
+
+class PhotonBackend(GeocoderBackend):
+    """Photon geocoder (komoot), typically self-hosted without a rate limit"""
+
+    name = "photon"
+    DEFAULT_URL = "http://localhost:2322/api"
+    ZONE_FIELDS = ("district", "locality")
+
+    def __init__(self, url: Optional[str] = None, rate: Optional[float] = None, max_workers: Optional[int] = None):
+        super().__init__(url or self.DEFAULT_URL, rate, max_workers or 16)
+
+    def queries(self, address: str, city: str) -> list[tuple[str, dict]]:
+        return [("free_text", {"q": f"{address}, {city}", "limit": 1})]
+
+    def parse(self, payload) -> Optional[GeocodeResult]:
+        features = payload.get("features") if payload else None
+        if not features:
+            return None
+        lon, lat = features[0]["geometry"]["coordinates"][:2]
+        properties = features[0].get("properties", {})
+        return GeocodeResult(
+            lat=float(lat),
+            lon=float(lon),
+            zone=next((properties[field] for field in self.ZONE_FIELDS if properties.get(field)), ""),
+        )
+
+
+class OfflineBackend(GeocoderBackend):
+    """No network access: zones come only from the cache, the gazetteer or nothing"""
+
+    name = "offline"
+    # Nothing was asked, so an empty answer must not hide the address from later online runs
+    CACHE_MISSES = False
+
+    def __init__(self, url: Optional[str] = None, rate: Optional[float] = None, max_workers: Optional[int] = None):
+        super().__init__("", None, 1)
+
+    def queries(self, address: str, city: str) -> list[tuple[str, dict]]:
+        return []
+
+    def parse(self, payload) -> Optional[GeocodeResult]:
+        return None
+
+
+GEOCODER_BACKENDS: dict[str, type[GeocoderBackend]] = {
+    backend.name: backend for backend in (NominatimBackend, PhotonBackend, OfflineBackend)
+}
+
+
+def open_geocoder_backend(
+    name: str = "nominatim",
+    url: Optional[str] = None,
+    rate: Optional[float] = None,
+    max_workers: Optional[int] = None,
+) -> GeocoderBackend:
+    """Create a geocoder backend by name, optionally overriding its URL, rate limit and concurrency"""
+    if name not in GEOCODER_BACKENDS:
+        raise ValueError(f"Unknown geocoder '{name}', expected one of {', '.join(GEOCODER_BACKENDS)}")
+    return GEOCODER_BACKENDS[name](url, rate, max_workers)
+
+
+class GeocodingService:
+    """Service to detect neighborhood/zone from address via a geocoder backend (Nominatim by default)"""
+
+    def __init__(
+        self,
+        cache_file: str = ".geocode_cache.json",
+        max_workers: Optional[int] = None,
+        cache: Optional[GeocodeCache] = None,
+        metrics: Optional[ScrapeMetrics] = None,
+        zone_index: Optional[ZoneIndex] = None,
+        gazetteer: Optional[StreetGazetteer] = None,
+        backend: Optional[GeocoderBackend] = None,
+    ):
+        self.backend = backend if backend is not None else NominatimBackend()
+        max_workers = max_workers or self.backend.max_workers
         self.session = requests.Session()
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=max_workers)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
         self.session.headers.update({
             "User-Agent": "AuctionScraper/1.0 (https://github.com/dalpozz/auction_scraper)",
         })
-        self.cache: dict[str, str] = self._load_cache()
+        self.cache = cache if cache is not None else open_geocode_cache(cache_file)
+        self.metrics = metrics if metrics is not None else ScrapeMetrics()
+        self.normalizer = AddressNormalizer()
+        # With local polygons, the backend only supplies coordinates
+        self.zone_index = zone_index
+        self.gazetteer = gazetteer
+        # Raw spellings per street key looked up in this run, to report the requests normalization saved
+        self._variants: dict[str, set[str]] = {}
+        self._pending: dict[str, Future[str]] = {}
+        self._pending_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="geocoder")
 
-    def _load_cache(self) -> dict[str, str]:
-        """Load cache from file if it exists"""
-        if self.cache_file.exists():
-            try:
-                return json.loads(self.cache_file.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
-                pass
-        return {}
+    def submit(self, address: str, city: str) -> Future[str]:
+        """Schedule a zone lookup in the background, sharing lookups already in flight"""
+        # Address spellings of the same street share one cache entry and one request
+        normalized = self.normalizer.normalize(address)
+        street = normalized.street
+        cache_key = f"{street}|{city}"
 
-    def _save_cache(self) -> None:
-        """Save cache to file"""
-        try:
-            self.cache_file.write_text(json.dumps(self.cache, ensure_ascii=False), encoding="utf-8")
-        except OSError as e:
-            logger.warning(f"Failed to save geocode cache: {e}")
+        # Answers cached for this exact address come first; the gazetteer only covers new ones
+        house = f"{street} {normalized.number}" if normalized.number else None
+        cached = self.cache.get(house, city) if house is not None else None
+        if cached is None and address not in (street, house):
+            # Entries written before normalization are keyed on the raw address
+            cached = self.cache.get(address, city)
+        if cached is None:
+            cached = self.cache.get(street, city)
+            if cached is not None:
+                self._count_saving(cache_key, address, city)
+        if cached is not None:
+            self.metrics.incr("geocode_cache_hits" if cached else "geocode_cache_negative_hits")
+            future: Future[str] = Future()
+            future.set_result(cached)
+            return future
+
+        known = self.gazetteer.lookup(street, city) if self.gazetteer is not None else None
+        if known is not None:
+            zone, confidence = known
+            if confidence >= self.gazetteer.min_confidence:
+                self.metrics.incr("geocode_gazetteer_hits")
+                future: Future[str] = Future()
+                future.set_result(zone)
+                return future
+            # The street crosses zone boundaries: geocode this house number on its own
+            self.metrics.incr("geocode_gazetteer_ambiguous")
+            if house is not None:
+                street = house
+                cache_key = f"{street}|{city}"
+
+        with self._pending_lock:
+            shared = self._pending.get(cache_key)
+            if shared is None:
+                self.metrics.incr("geocode_cache_misses")
+                self._variants[cache_key] = {address}
+                # The street-level key is cached, the full address (house number included) is queried
+                future = self._executor.submit(self._lookup, street, city, address)
+                self._pending[cache_key] = future
+        if shared is not None:
+            self.metrics.incr("geocode_inflight_shared")
+            self._count_saving(cache_key, address, city)
+            return shared
+        # Outside the lock: a lookup that already finished runs the callback right here
+        future.add_done_callback(lambda done: self._forget(cache_key, done))
+        return future
+
+    def _count_saving(self, cache_key: str, address: str, city: str) -> None:
+        """Count a request avoided because another spelling of the street was looked up in this run"""
+        with self._pending_lock:
+            variants = self._variants.get(cache_key)
+            if variants is None or address in variants:
+                return
+            variants.add(address)
+        # Keyed on the raw address, this spelling would have needed a request of its own
+        if self.cache.get(address, city) is None:
+            self.metrics.incr("geocode_requests_saved")
+
+    def _forget(self, cache_key: str, future: Future[str]) -> None:
+        """Drop a finished lookup from the in-flight table"""
+        with self._pending_lock:
+            if self._pending.get(cache_key) is future:
+                del self._pending[cache_key]
 
     def get_zone(self, address: str, city: str) -> str:
-        """Get neighborhood/zone for an address using Nominatim API"""
-        cache_key = f"{address}|{city}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        """Get neighborhood/zone for an address from the cache, the gazetteer or the geocoder backend"""
+        return self.submit(address, city).result()
+
+    def flush(self) -> None:
+        """Persist pending cache entries"""
+        self.cache.flush()
+
+    def close(self) -> None:
+        """Drop queued lookups, wait for those in flight, release the worker threads and close the cache"""
+        # After an interrupt, queued addresses would otherwise keep a rate-limited backend busy for minutes
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.cache.close()
+
+    def _remember(self, address: str, city: str, zone: str) -> None:
+        """Cache a lookup result and teach it to the gazetteer"""
+        self.cache.set(address, city, zone)
+        if self.gazetteer is not None:
+            self.gazetteer.add(address, city, zone)
+
+    def _lookup(self, key: str, city: str, address: str) -> str:
+        """Ask the backend for an address and cache the zone under its street key, respecting the rate limit"""
+        cached = self.cache.get(key, city)
+        if cached is not None:
+            return cached
+
+        for strategy, params in self.backend.queries(address, city):
+            self.metrics.incr(f"geocode_{strategy}_requests")
+            try:
+                if self.backend.rate_limiter is not None:
+                    self.backend.rate_limiter.acquire()
 
-        query = f"{address}, {city}, Italia"
+                self.metrics.incr("geocode_requests")
+                with self.metrics.stage("geocode_request"):
+                    response = self.session.get(self.backend.url, params=params, timeout=10)
+                self.metrics.record_retries(response)
+                self.metrics.incr("bytes_downloaded", len(response.content))
+                response.raise_for_status()
+                result = self.backend.parse(response.json())
 
+            except requests.RequestException as e:
+                # Transient failures are not cached so the address is retried later
+                self.metrics.incr("geocode_failures")
+                logger.warning(f"Geocoding request failed for '{address}, {city}' ({strategy}): {e}")
+                return ""
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                logger.warning(f"Geocoding parse error for '{address}, {city}' ({strategy}): {e}")
+                continue
+
+            if result is None:
+                continue
+            zone = result.zone
+            if self.zone_index is not None and result.lat is not None and result.lon is not None:
+                local = self.zone_index.lookup(result.lat, result.lon)
+                self.metrics.incr("zone_index_hits" if local else "zone_index_misses")
+                zone = local or zone
+            self.metrics.incr(f"geocode_{strategy}_hits")
+            if zone:
+                self._remember(key, city, zone)
+                return zone
+            # Found, but in a comune without zones: looser queries would find the same place
+            self.metrics.incr("geocode_zoneless_matches")
+            break
+
+        if self.backend.CACHE_MISSES:
+            self.cache.set(key, city, "")
+        return ""
+
+
+@dataclass
+class SeenItem:
+    """A feed item processed in an earlier run, with a hash of its raw content"""
+    content_hash: str
+    auction: Auction
+
+
+@dataclass
+class FeedChanges:
+    """Auctions added, changed or removed since the previous run"""
+    added: list[Auction] = field(default_factory=list)
+    changed: list[Auction] = field(default_factory=list)
+    removed: list[Auction] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict"""
+        return {
+            "added": [auction.to_dict() for auction in self.added],
+            "changed": [auction.to_dict() for auction in self.changed],
+            "removed": [auction.to_dict() for auction in self.removed],
+        }
+
+
+class FeedStateStore:
+    """Per-feed seen items keyed by reference and per-request HTTP validators, persisted as a JSON file"""
+
+    def __init__(self, state_file: str = ".feed_state.json"):
+        self.state_file = Path(state_file)
+        self._lock = threading.Lock()
+        self.state: dict[str, dict] = self._load_state()
+
+    def _load_state(self) -> dict[str, dict]:
+        """Load state from file if it exists"""
+        if not self.state_file.exists():
+            return {}
         try:
-            time.sleep(1)
-
-            response = self.session.get(
-                self.NOMINATIM_URL,
-                params={
-                    "q": query,
-                    "format": "json",
-                    "addressdetails": 1,
-                    "limit": 1,
+            raw = json.loads(self.state_file.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable feed state {self.state_file}: {e}")
+            return {}
+
+        state = {}
+        for feed_url, entry in raw.items():
+            items = {
+                key: SeenItem(item["hash"], Auction.from_dict(item["auction"]))
+                for key, item in entry.get("items", {}).items()
+            }
+            state[feed_url] = {"requests": entry.get("requests", {}), "items": items}
+        return state
+
+    def get_items(self, feed_url: str) -> dict[str, SeenItem]:
+        """Return the items seen in the last complete crawl of a feed"""
+        return self.state.get(feed_url, {}).get("items", {})
+
+    def get_requests(self, feed_url: str) -> dict[str, dict]:
+        """Return the validators, item keys and item count of each request made for a feed"""
+        return self.state.get(feed_url, {}).get("requests", {})
+
+    def update(self, feed_url: str, items: dict[str, SeenItem], requests_made: dict[str, dict]) -> None:
+        """Replace the seen items and request records of a feed after a complete crawl"""
+        with self._lock:
+            self.state[feed_url] = {"requests": requests_made, "items": items}
+
+    def save(self) -> None:
+        """Persist the state, including zones filled in after the feed was parsed"""
+        with self._lock:
+            data = json.dumps(
+                {
+                    feed_url: {
+                        **entry,
+                        "items": {
+                            key: {"hash": item.content_hash, "auction": item.auction.to_dict()}
+                            for key, item in entry["items"].items()
+                        },
+                    }
+                    for feed_url, entry in self.state.items()
                 },
-                timeout=10,
+                ensure_ascii=False,
             )
-            response.raise_for_status()
+        try:
+            _atomic_write_text(self.state_file, data)
+        except OSError as e:
+            logger.warning(f"Failed to save feed state: {e}")
 
-            results = response.json()
-            if results and "address" in results[0]:
-                addr = results[0]["address"]
-                zone = (
-                    addr.get("suburb") or
-                    addr.get("neighbourhood") or
-                    addr.get("quarter") or
-                    addr.get("city_district") or
-                    ""
-                )
-                self.cache[cache_key] = zone
-                self._save_cache()
-                return zone
 
-        except requests.RequestException as e:
-            logger.warning(f"Geocoding request failed for '{query}': {e}")
-        except (KeyError, IndexError, ValueError) as e:
-            logger.warning(f"Geocoding parse error for '{query}': {e}")
+@dataclass
+class FeedCrawl:
+    """Items and per-request records collected while crawling the pages or bands of one feed"""
+    feed_url: str
+    previous: dict[str, SeenItem] = field(default_factory=dict)
+    saved_requests: dict[str, dict] = field(default_factory=dict)
+    current: dict[str, SeenItem] = field(default_factory=dict)
+    requests: dict[str, dict] = field(default_factory=dict)
+    complete: bool = True
+    _claimed: set[str] = field(default_factory=set)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
 
-        self.cache[cache_key] = ""
-        return ""
+    def claim(self, key: str) -> bool:
+        """Return True the first time a listing is seen across all requests of the crawl"""
+        with self._lock:
+            if key in self._claimed:
+                return False
+            self._claimed.add(key)
+            return True
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from the last response to a request"""
+        record = self.saved_requests.get(url, {})
+        headers = {}
+        if record.get("etag"):
+            headers["If-None-Match"] = record["etag"]
+        if record.get("last_modified"):
+            headers["If-Modified-Since"] = record["last_modified"]
+        return headers
+
+
+class ListingParser:
+    """Extracts auction fields from an RSS item title and description with precompiled patterns"""
+
+    PRICE_PATTERN = re.compile(r"Prezzo:\s*([\d.,]+)\s*€")
+    DATE_PATTERN = re.compile(r"Data asta:\s*(\d{2})/(\d{2})/(\d{4})")
+    PROPERTY_TYPE_PATTERN = re.compile(r"Tipologia:\s*([^-]+)")
+    TRIBUNAL_PATTERN = re.compile(r"Tribunale di ([^-]+)")
+    REFERENCE_PATTERN = re.compile(r"Rif\. #(\w+)")
+
+    def parse(self, title: str, description: str, url: str) -> Optional[Auction]:
+        """Build an Auction from the item texts, or None if it has no valid price"""
+        # The price is mandatory, so check it first and skip everything else when missing
+        match = self.PRICE_PATTERN.search(description)
+        if match is None:
+            return None
+        try:
+            # Italian format: 70.000,00 -> 70000.00
+            base_price = float(match.group(1).replace(".", "").replace(",", "."))
+        except ValueError:
+            return None
+
+        auction_date = None
+        match = self.DATE_PATTERN.search(description)
+        if match:
+            day, month, year = match.groups()
+            try:
+                auction_date = datetime(int(year), int(month), int(day))
+            except ValueError:
+                pass
+
+        match = self.PROPERTY_TYPE_PATTERN.search(description)
+        property_type = match.group(1).strip() if match else "Unknown"
+
+        match = self.TRIBUNAL_PATTERN.search(title)
+        tribunal = f"Tribunale di {match.group(1).strip()}" if match else ""
+
+        return Auction(
+            title=title,
+            address=title.partition(" - Lotto")[0].strip(),
+            zone="",  # Will be populated later via geocoding
+            description=description.partition(" - Tipologia:")[0].strip(),
+            tribunal=tribunal,
+            auction_date=auction_date,
+            base_price=base_price,
+            url=url,
+            reference=self.extract_reference(title),
+            property_type=property_type,
+        )
+
+    def extract_reference(self, title: str) -> str:
+        """Extract reference number from title like '... - Rif. #12345'"""
+        match = self.REFERENCE_PATTERN.search(title)
+        return match.group(1) if match else ""
+
+
+@dataclass(frozen=True)
+class FeedTarget:
+    """Region, province and comune selecting one astalegale RSS feed"""
+    region: str = "piemonte"
+    province: str = "to"
+    comune: str = "torino"
+
+    @classmethod
+    def parse(cls, spec: str) -> "FeedTarget":
+        """Parse a 'region/province/comune' specification"""
+        parts = [part.strip().lower() for part in spec.split("/")]
+        if len(parts) != 3 or not all(parts):
+            raise ValueError(f"Invalid target '{spec}', expected REGION/PROVINCE/COMUNE")
+        return cls(*parts)
+
+
+class AuctionTable:
+    """Column-oriented auctions with vectorized filters and sorting (requires numpy)
+
+    Prices are float64, dates whole epoch days (undated auctions sort last) and
+    zone, tribunal, property type and city interned integer codes. Rows become
+    Auction objects again only when indexed or iterated.
+    """
+
+    EPOCH = datetime(1970, 1, 1)
+    UNDATED = 2**31 - 1
+    CATEGORIES = ("zone", "tribunal", "property_type", "city")
+    TEXT = ("title", "address", "description", "url", "reference")
+
+    def __init__(self, auctions: Iterable[Auction] = ()):
+        # Imported lazily: numpy is an optional dependency
+        import numpy as np
+
+        self._np = np
+        prices: list[float] = []
+        days: list[int] = []
+        codes: dict[str, list[int]] = {column: [] for column in self.CATEGORIES}
+        lookups: dict[str, dict[str, int]] = {column: {} for column in self.CATEGORIES}
+        self.categories: dict[str, list[str]] = {column: [] for column in self.CATEGORIES}
+        self.text: dict[str, list[str]] = {column: [] for column in self.TEXT}
+
+        for auction in auctions:
+            prices.append(auction.base_price)
+            days.append((auction.auction_date - self.EPOCH).days if auction.auction_date else self.UNDATED)
+            for column in self.TEXT:
+                self.text[column].append(getattr(auction, column))
+            for column in self.CATEGORIES:
+                value = getattr(auction, column)
+                code = lookups[column].get(value)
+                if code is None:
+                    code = lookups[column][value] = len(self.categories[column])
+                    self.categories[column].append(value)
+                codes[column].append(code)
+
+        self.price = np.array(prices, dtype=np.float64)
+        self.day = np.array(days, dtype=np.int32)
+        self.codes = {column: np.array(values, dtype=np.int32) for column, values in codes.items()}
+        # Text columns are shared between a table and its subsets: rows point into them
+        self._rows = np.arange(len(prices), dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, i: int) -> Auction:
+        row = int(self._rows[i])
+        day = int(self.day[i])
+        return Auction(
+            **{column: self.text[column][row] for column in self.TEXT},
+            **{column: self.categories[column][self.codes[column][i]] for column in self.CATEGORIES},
+            auction_date=self.EPOCH + timedelta(days=day) if day != self.UNDATED else None,
+            base_price=float(self.price[i]),
+        )
+
+    def __iter__(self) -> Iterator[Auction]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def take(self, indices) -> "AuctionTable":
+        """Subset of the rows at the given positions, in that order"""
+        table = object.__new__(AuctionTable)
+        table._np = self._np
+        table.categories = self.categories
+        table.text = self.text
+        table.price = self.price[indices]
+        table.day = self.day[indices]
+        table.codes = {column: codes[indices] for column, codes in self.codes.items()}
+        table._rows = self._rows[indices]
+        return table
+
+    def budget_mask(self, max_budget: float):
+        """Rows priced within the budget"""
+        return self.price <= max_budget
+
+    def date_mask(self, start: datetime, end: datetime, include_undated: bool = False):
+        """Rows dated between start and end inclusive, plus undated ones if requested"""
+        # Fractional day bounds keep the datetime comparison exact for midnight dates
+        first = (start - self.EPOCH) / timedelta(days=1)
+        last = (end - self.EPOCH) / timedelta(days=1)
+        mask = (self.day >= first) & (self.day <= last)
+        if include_undated:
+            mask |= self.day == self.UNDATED
+        return mask
+
+    def category_mask(self, column: str, value: str):
+        """Rows whose categorical column equals a value"""
+        try:
+            code = self.categories[column].index(value)
+        except ValueError:
+            return self._np.zeros(len(self), dtype=bool)
+        return self.codes[column] == code
+
+    def argsort(self):
+        """Positions in date order, undated last, ties kept in insertion order"""
+        return self._np.argsort(self.day, kind="stable")
+
+    def select(self, mask) -> "AuctionTable":
+        """Rows matching a boolean mask, sorted by date"""
+        indices = self._np.flatnonzero(mask)
+        return self.take(indices[self._np.argsort(self.day[indices], kind="stable")])
+
+
+@dataclass(frozen=True)
+class FilterProfile:
+    """Named budget and date window selecting auctions from the parsed dataset"""
+    name: str = "default"
+    max_budget: float = 150000
+    months_ahead: int = 3
+    include_undated: bool = False
+
+    NAME_PATTERN = re.compile(r"^[\w-]+$")
+
+    def __post_init__(self):
+        if not self.NAME_PATTERN.match(self.name):
+            raise ValueError(f"Invalid profile name '{self.name}', use letters, digits, '_' or '-'")
+        if self.max_budget <= 0:
+            raise ValueError("Budget must be a positive value")
+        if self.months_ahead <= 0:
+            raise ValueError("Months ahead must be a positive value")
+
+    @classmethod
+    def parse(cls, spec: str) -> "FilterProfile":
+        """Parse a 'name:budget[:months[:undated]]' specification"""
+        parts = [part.strip() for part in spec.split(":")]
+        if not 2 <= len(parts) <= 4 or (len(parts) == 4 and parts[3].lower() != "undated"):
+            raise ValueError(f"Invalid profile '{spec}', expected NAME:BUDGET[:MONTHS[:undated]]")
+        try:
+            months = int(parts[2]) if len(parts) > 2 else cls.months_ahead
+            return cls(parts[0], float(parts[1]), months, len(parts) == 4)
+        except ValueError as e:
+            raise ValueError(f"Invalid profile '{spec}': {e}") from None
+
+    def cutoff(self, now: datetime) -> datetime:
+        """Latest auction date accepted when filtering at the given time"""
+        return now + timedelta(days=self.months_ahead * 30)
+
+    def matches(self, auction: Auction, now: Optional[datetime] = None) -> bool:
+        """Check an auction against the budget and date filters"""
+        if auction.base_price > self.max_budget:
+            return False
+        if auction.auction_date is None:
+            return self.include_undated
+        now = now or datetime.now()
+        return now <= auction.auction_date <= self.cutoff(now)
+
+    def mask(self, table: AuctionTable, now: Optional[datetime] = None):
+        """Vectorized matches() over every row of a table"""
+        now = now or datetime.now()
+        return table.budget_mask(self.max_budget) & table.date_mask(now, self.cutoff(now), self.include_undated)
+
+    def apply(self, auctions: Iterable[Auction], now: Optional[datetime] = None) -> Union[AuctionTable, list[Auction]]:
+        """Select the matching auctions, sorted by date with undated ones last (vectorized for an AuctionTable)"""
+        now = now or datetime.now()
+        if isinstance(auctions, AuctionTable):
+            return auctions.select(self.mask(auctions, now))
+        selected = [auction for auction in auctions if self.matches(auction, now)]
+        selected.sort(key=lambda a: a.auction_date or datetime.max)
+        return selected
+
+
+class AuctionSink(ABC):
+    """Output that auctions are written to one at a time, as they are produced"""
+
+    stage = "write"
+
+    def __init__(self, metrics: Optional[ScrapeMetrics] = None):
+        self.metrics = metrics if metrics is not None else ScrapeMetrics()
+        self.count = 0
+        self._seconds = 0.0
+
+    def write(self, auction: Auction) -> None:
+        """Write one auction"""
+        start = time.perf_counter()
+        self._write(auction)
+        self._seconds += time.perf_counter() - start
+        self.count += 1
+
+    def close(self) -> None:
+        """Flush and close the output"""
+        start = time.perf_counter()
+        self._close()
+        self.metrics.record(self.stage, self._seconds + time.perf_counter() - start, self.count, self.count)
+
+    @abstractmethod
+    def _write(self, auction: Auction) -> None:
+        """Write one auction to the underlying output"""
+
+    @abstractmethod
+    def _close(self) -> None:
+        """Flush and close the underlying output"""
+
+    def __enter__(self) -> "AuctionSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _open_text_output(filename: str, line_buffered: bool = False) -> TextIO:
+    """Open a text output file, or standard output for '-'"""
+    if filename == "-":
+        return sys.stdout
+    return open(filename, "w", encoding="utf-8", newline="", buffering=1 if line_buffered else -1)
+
+
+def _close_text_output(f: TextIO) -> None:
+    """Close an output opened by _open_text_output, leaving standard output open"""
+    if f is sys.stdout:
+        f.flush()
+    else:
+        f.close()
+
+
+class CsvSink(AuctionSink):
+    """CSV output, optionally line-buffered so each row reaches the file as soon as it is written"""
+
+    stage = "csv_write"
+    COLUMNS = ["address", "zone", "property_type", "auction_date", "base_price", "tribunal", "reference", "url", "description"]
+
+    def __init__(self, filename: str, metrics: Optional[ScrapeMetrics] = None, line_buffered: bool = False):
+        super().__init__(metrics)
+        self._file = _open_text_output(filename, line_buffered)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.COLUMNS)
+
+    def _write(self, a: Auction) -> None:
+        self._writer.writerow([
+            a.address,
+            a.zone,
+            a.property_type,
+            a.auction_date.strftime("%d/%m/%Y") if a.auction_date else "",
+            a.base_price,
+            a.tribunal,
+            a.reference,
+            a.url,
+            a.description,
+        ])
+
+    def _close(self) -> None:
+        _close_text_output(self._file)
+
+
+def _json_record(auction: Auction) -> dict:
+    """Auction as a JSON-ready dict with an ISO date (YYYY-MM-DD) and a numeric price"""
+    data = auction.to_dict()
+    data["auction_date"] = auction.auction_date.date().isoformat() if auction.auction_date else None
+    return data
+
+
+class JsonLinesSink(AuctionSink):
+    """JSON Lines output with ISO dates and numeric prices, one auction per line"""
+
+    stage = "jsonl_write"
+
+    def __init__(self, filename: str, metrics: Optional[ScrapeMetrics] = None, line_buffered: bool = False):
+        super().__init__(metrics)
+        self._file = _open_text_output(filename, line_buffered)
+        # Pipes are block-buffered by default: flush every line so consumers see it immediately
+        self._flush = line_buffered or self._file is sys.stdout
+
+    def _write(self, auction: Auction) -> None:
+        self._file.write(json.dumps(_json_record(auction), ensure_ascii=False) + "\n")
+        if self._flush:
+            self._file.flush()
+
+    def _close(self) -> None:
+        _close_text_output(self._file)
+
+
+class ParquetSink(AuctionSink):
+    """Parquet output with typed, dictionary-encoded columns, written one row group at a time (requires pyarrow)"""
+
+    stage = "parquet_write"
+
+    def __init__(self, filename: str, metrics: Optional[ScrapeMetrics] = None, row_group_size: int = 65536):
+        super().__init__(metrics)
+        # Imported lazily: pyarrow is an optional dependency and slow to import
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        category = pa.dictionary(pa.int32(), pa.string())
+        self.schema = pa.schema([
+            ("address", pa.string()),
+            ("zone", category),
+            ("property_type", category),
+            ("auction_date", pa.date32()),
+            ("base_price", pa.float64()),
+            ("tribunal", category),
+            ("reference", pa.string()),
+            ("url", pa.string()),
+            ("description", pa.string()),
+            ("city", category),
+        ])
+        self.row_group_size = row_group_size
+        self._rows: list[Auction] = []
+        self._writer = pq.ParquetWriter(filename, self.schema, compression="zstd")
+
+    def _write(self, auction: Auction) -> None:
+        self._rows.append(auction)
+        if len(self._rows) >= self.row_group_size:
+            self._write_row_group()
+
+    def _write_row_group(self) -> None:
+        """Write the buffered auctions as one row group"""
+        batch, self._rows = self._rows, []
+        columns = [
+            [a.address for a in batch],
+            [a.zone for a in batch],
+            [a.property_type for a in batch],
+            [a.auction_date.date() if a.auction_date else None for a in batch],
+            [a.base_price for a in batch],
+            [a.tribunal for a in batch],
+            [a.reference for a in batch],
+            [a.url for a in batch],
+            [a.description for a in batch],
+            [a.city for a in batch],
+        ]
+        arrays = [self._pa.array(values, type=column.type) for values, column in zip(columns, self.schema)]
+        self._writer.write_batch(self._pa.RecordBatch.from_arrays(arrays, schema=self.schema), row_group_size=self.row_group_size)
+
+    def _close(self) -> None:
+        if self._rows:
+            self._write_row_group()
+        self._writer.close()
+
+
+def open_sink(output_format: str, filename: str, metrics: Optional[ScrapeMetrics] = None, streaming: bool = False) -> AuctionSink:
+    """Open the sink for an output format; '-' writes CSV or JSON Lines to standard output"""
+    if output_format == "parquet":
+        if filename == "-":
+            raise ValueError("Parquet output cannot be written to standard output")
+        return ParquetSink(filename, metrics=metrics)
+    if output_format == "jsonl":
+        return JsonLinesSink(filename, metrics=metrics, line_buffered=streaming)
+    return CsvSink(filename, metrics=metrics, line_buffered=streaming)
 
 
 class AstaLegaleScraper:
@@ -134,209 +1539,492 @@ class AstaLegaleScraper:
 
     BASE_URL = "https://www.astalegale.net"
     RSS_URL = "https://www.astalegale.net/Immobili/Rss"
+    FEED_CHUNK_SIZE = 64 * 1024
+    MAX_CONNECTIONS_PER_HOST = 4
+    # Responses seem to stop at this many items; not confirmed against the
+    # live endpoint, so truncation handling stays off unless asked for
+    FEED_ITEM_CAP = 100
+    # Upper bound on requests spent completing one truncated feed
+    MAX_FEED_REQUESTS = 32
+    PAGE_PARAM = "page"
+    PRICE_MIN_PARAM = "prezzoDa"
+    PRICE_MAX_PARAM = "prezzoA"
+    MIN_PRICE_BAND = 1000
 
-    def __init__(self, max_budget: float = 150000, city: str = "torino", months_ahead: int = 3, include_undated: bool = False):
-        if max_budget <= 0:
-            raise ValueError("Budget must be a positive value")
-        if months_ahead <= 0:
-            raise ValueError("Months ahead must be a positive value")
-
-        self.max_budget = max_budget
+    def __init__(
+        self,
+        max_budget: float = 150000,
+        city: str = "torino",
+        months_ahead: int = 3,
+        include_undated: bool = False,
+        geocoder: Optional[GeocodingService] = None,
+        feed_state: Optional[FeedStateStore] = None,
+        targets: Optional[list[FeedTarget]] = None,
+        metrics: Optional[ScrapeMetrics] = None,
+        feed_item_cap: Optional[int] = None,
+        profiles: Optional[list[FilterProfile]] = None,
+    ):
+        # Listings are geocoded when any profile matches; the budget and months
+        # arguments define the only profile when none are given
+        self.profiles = list(profiles) if profiles else [FilterProfile("default", max_budget, months_ahead, include_undated)]
+        self.max_budget = max(profile.max_budget for profile in self.profiles)
         self.city = city.lower()
-        self.months_ahead = months_ahead
-        self.include_undated = include_undated
-        self.cutoff_date = datetime.now() + timedelta(days=months_ahead * 30)
+        self.targets = list(targets) if targets else [FeedTarget(comune=self.city)]
+        self.months_ahead = max(profile.months_ahead for profile in self.profiles)
+        self.include_undated = any(profile.include_undated for profile in self.profiles)
+        self.feed_item_cap = feed_item_cap
+        self.cutoff_date = datetime.now() + timedelta(days=self.months_ahead * 30)
         self.session = requests.Session()
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=self.MAX_CONNECTIONS_PER_HOST)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "Accept": "application/rss+xml, application/xml, text/xml",
         })
-        self.geocoder = GeocodingService()
+        self.metrics = metrics if metrics is not None else ScrapeMetrics()
+        self.geocoder = geocoder if geocoder is not None else GeocodingService(metrics=self.metrics)
+        self.feed_state = feed_state
+        self.parser = ListingParser()
+        self.changes = FeedChanges()
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
     
-    def _build_rss_url(self) -> str:
-        """Build the RSS feed URL with filters"""
+    def _build_rss_url(
+        self,
+        target: Optional[FeedTarget] = None,
+        page: Optional[int] = None,
+        price_band: Optional[tuple[int, int]] = None,
+    ) -> str:
+        """Build the RSS feed URL with filters, optionally for one page or price band"""
+        target = target or self.targets[0]
         params = [
             "categories=residenziali",
-            "regioni=piemonte",
-            "province=to",
-            f"comuni={self.city}",
+            f"regioni={target.region}",
+            f"province={target.province}",
+            f"comuni={target.comune}",
         ]
+        if page is not None:
+            params.append(f"{self.PAGE_PARAM}={page}")
+        if price_band is not None:
+            params.append(f"{self.PRICE_MIN_PARAM}={price_band[0]}")
+            params.append(f"{self.PRICE_MAX_PARAM}={price_band[1]}")
         return f"{self.RSS_URL}?{'&'.join(params)}"
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Return the semaphore bounding concurrent feed downloads from the host of a URL"""
+        host = urlsplit(url).netloc
+        with self._host_slots_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.MAX_CONNECTIONS_PER_HOST)
+            return self._host_slots[host]
     
-    def _parse_price(self, text: str) -> Optional[float]:
-        """Extract price from text like 'Prezzo: 70.000,00 €'"""
-        match = re.search(r"Prezzo:\s*([\d.,]+)\s*€", text)
-        if match:
-            price_str = match.group(1)
-            # Italian format: 70.000,00 -> 70000.00
-            cleaned = price_str.replace(".", "").replace(",", ".")
-            try:
-                return float(cleaned)
-            except ValueError:
-                return None
-        return None
-    
-    def _parse_auction_date(self, text: str) -> Optional[datetime]:
-        """Extract auction date from text like 'Data asta: 17/03/2026 - 12:00'"""
-        match = re.search(r"Data asta:\s*(\d{2}/\d{2}/\d{4})", text)
-        if match:
-            try:
-                return datetime.strptime(match.group(1), "%d/%m/%Y")
-            except ValueError:
-                return None
-        return None
-    
-    def _parse_property_type(self, text: str) -> str:
-        """Extract property type from text like 'Tipologia: Abitazione di tipo civile'"""
-        match = re.search(r"Tipologia:\s*([^-]+)", text)
-        if match:
-            return match.group(1).strip()
-        return "Unknown"
-    
-    def _detect_zone(self, address: str) -> str:
-        """Detect neighborhood from address using geocoding"""
-        return self.geocoder.get_zone(address, self.city)
-    
-    def _extract_address_from_title(self, title: str) -> str:
-        """Extract address from title (first part before ' - Lotto')"""
-        parts = title.split(" - Lotto")
-        if parts:
-            return parts[0].strip()
-        return title
-    
-    def _extract_tribunal(self, title: str) -> str:
-        """Extract tribunal from title"""
-        match = re.search(r"Tribunale di ([^-]+)", title)
-        if match:
-            return f"Tribunale di {match.group(1).strip()}"
-        return ""
-    
-    def _extract_reference(self, title: str) -> str:
-        """Extract reference number from title"""
-        match = re.search(r"Rif\. #(\w+)", title)
-        if match:
-            return match.group(1)
-        return ""
+    def _detect_zone(self, auction: Auction) -> Future[str]:
+        """Start detecting the neighborhood of an auction via background geocoding"""
+        return self.geocoder.submit(auction.address, auction.city or self.city)
     
-    def _parse_rss_item(self, item: ET.Element) -> Optional[Auction]:
-        """Parse a single RSS item into an Auction object"""
+    def _item_fingerprint(self, title: str, description: str, url: str) -> tuple[str, str]:
+        """Return the store key (reference, falling back to URL) and content hash of an RSS item"""
+        key = self.parser.extract_reference(title) or url
+        content_hash = hashlib.sha1("\0".join((title, description, url)).encode("utf-8")).hexdigest()
+        return key, content_hash
+
+    def _item_texts(self, item: ET.Element) -> Optional[tuple[str, str, str]]:
+        """Return the title, description and link text of an RSS item"""
         title_elem = item.find("title")
         desc_elem = item.find("description")
         link_elem = item.find("link")
-        
+
         if title_elem is None or desc_elem is None or link_elem is None:
             return None
-        
-        title = title_elem.text or ""
-        description = desc_elem.text or ""
-        url = link_elem.text or ""
-        
-        # Extract data from description
-        base_price = self._parse_price(description)
-        auction_date = self._parse_auction_date(description)
-        property_type = self._parse_property_type(description)
-        
-        # Extract data from title
-        address = self._extract_address_from_title(title)
-        tribunal = self._extract_tribunal(title)
-        reference = self._extract_reference(title)
-        
-        # Detect neighborhood
-        desc_text = description.split(" - Tipologia:")[0].strip()
-        
-        if base_price is None:
+
+        return title_elem.text or "", desc_elem.text or "", link_elem.text or ""
+
+    def _parse_rss_item(self, item: ET.Element) -> Optional[Auction]:
+        """Parse a single RSS item into an Auction object"""
+        texts = self._item_texts(item)
+        if texts is None:
             return None
-        
-        return Auction(
-            title=title,
-            address=address,
-            zone="",  # Will be populated later via geocoding
-            description=desc_text,
-            tribunal=tribunal,
-            auction_date=auction_date,
-            base_price=base_price,
-            url=url,
-            reference=reference,
-            property_type=property_type,
-        )
+        return self.parser.parse(*texts)
     
-    def scrape(self) -> list[Auction]:
-        """Scrape auction listings from RSS feed"""
-        all_auctions = []
+    def _iter_feed_items(self, response: requests.Response) -> Iterator[ET.Element]:
+        """Incrementally parse a streamed RSS response, yielding each <item> as soon as it closes"""
+        parser = ET.XMLPullParser(events=("start", "end"))
+        stack: list[ET.Element] = []
 
-        logger.info(f"Scraping apartments in {self.city.title()}")
-        logger.info(f"Max budget: €{self.max_budget:,.2f}")
-        logger.info(f"Auction date range: now to {self.cutoff_date.strftime('%d/%m/%Y')}")
+        def drain() -> Iterator[ET.Element]:
+            for event, elem in parser.read_events():
+                if event == "start":
+                    stack.append(elem)
+                    continue
+                stack.pop()
+                if elem.tag == "item":
+                    yield elem
+                    # Drop the finished item so the tree never grows past one listing
+                    elem.clear()
+                    if stack:
+                        stack[-1].remove(elem)
+
+        for chunk in self._read_chunks(response):
+            with self.metrics.stage("xml_parse"):
+                parser.feed(chunk)
+            yield from drain()
+        with self.metrics.stage("xml_parse"):
+            parser.close()
+        yield from drain()
+
+    def _read_chunks(self, response: requests.Response) -> Iterator[bytes]:
+        """Yield the chunks of a streamed response, recording download time and size"""
+        chunks = response.iter_content(chunk_size=self.FEED_CHUNK_SIZE)
+        while True:
+            with self.metrics.stage("fetch"):
+                chunk = next(chunks, None)
+            if chunk is None:
+                return
+            self.metrics.incr("bytes_downloaded", len(chunk))
+            yield chunk
 
-        url = self._build_rss_url()
+    def _passes_filters(self, auction: Auction, now: datetime) -> bool:
+        """Check whether any filter profile selects an auction"""
+        if any(profile.matches(auction, now) for profile in self.profiles):
+            return True
+        logger.debug(f"Skipping auction outside all filter profiles: {auction.address}")
+        return False
+
+    def iter_auctions(self, target: Optional[FeedTarget] = None) -> Iterator[Auction]:
+        """Stream auctions matching the filters while the RSS feed is still downloading"""
+        target = target or self.targets[0]
+        feed_url = self._build_rss_url(target)
+        crawl = FeedCrawl(feed_url)
+        if self.feed_state:
+            crawl.previous = self.feed_state.get_items(feed_url)
+            crawl.saved_requests = self.feed_state.get_requests(feed_url)
+        now = datetime.now()
+
+        with self._host_slot(feed_url):
+            yield from self._iter_request(crawl, feed_url, target, now)
+        if self._is_capped(crawl, feed_url):
+            yield from self._iter_overflow(crawl, target, now)
+
+        logger.info(f"Found {len(crawl.current)} total listings in {target.comune.title()}")
+
+        if self.feed_state and crawl.complete:
+            for key, seen in crawl.previous.items():
+                if key not in crawl.current and self._passes_filters(seen.auction, now):
+                    self.changes.removed.append(seen.auction)
+            self.feed_state.update(feed_url, crawl.current, crawl.requests)
+
+    def _is_capped(self, crawl: FeedCrawl, url: str) -> bool:
+        """Check whether the response to a request hit the server's item cap"""
+        record = crawl.requests.get(url)
+        return bool(self.feed_item_cap and record and record["count"] == self.feed_item_cap)
+
+    def _fetch_request(self, crawl: FeedCrawl, url: str, target: FeedTarget, now: datetime) -> list[Auction]:
+        """Fetch one page or band of a feed in a worker thread, within the per-host limit"""
+        with self._host_slot(url):
+            return list(self._iter_request(crawl, url, target, now))
+
+    def _iter_overflow(self, crawl: FeedCrawl, target: FeedTarget, now: datetime) -> Iterator[Auction]:
+        """Fetch the rest of a truncated feed by following pages, or by splitting it into price bands"""
+        self.metrics.incr("feeds_truncated")
+        first_keys = set(crawl.requests[crawl.feed_url]["keys"])
+        second_page = self._build_rss_url(target, page=2)
+        yield from self._fetch_request(crawl, second_page, target, now)
+
+        record = crawl.requests.get(second_page)
+        if record is not None and set(record["keys"]) - first_keys:
+            logger.info(f"RSS feed for {target.comune.title()} is truncated, following pages")
+            if self._is_capped(crawl, second_page):
+                yield from self._iter_pages(crawl, target, now, first_page=3)
+            return
+
+        # Probe one band before committing to the split: a band that narrows the
+        # feed drops some listings or reaches past the cap, while a server that
+        # ignores the price parameters answers it with the same listings
+        bands = self._price_bands()
+        probe_url = self._build_rss_url(target, price_band=bands[0])
+        yield from self._fetch_request(crawl, probe_url, target, now)
+        record = crawl.requests.get(probe_url)
+        if record is None:
+            return
+        if set(record["keys"]) == first_keys:
+            logger.warning(f"RSS feed for {target.comune.title()} ignores paging and price bands, keeping the first {len(first_keys)} listings")
+            return
+        logger.info(f"RSS feed for {target.comune.title()} is truncated, splitting it by price band")
+        yield from self._iter_price_bands(crawl, target, now, self._split_band(crawl, probe_url, bands[0], target) + bands[1:])
+
+    def _iter_pages(self, crawl: FeedCrawl, target: FeedTarget, now: datetime, first_page: int) -> Iterator[Auction]:
+        """Fetch pages concurrently in waves until one comes back short or the request budget runs out"""
+        page = first_page
+        with ThreadPoolExecutor(max_workers=self.MAX_CONNECTIONS_PER_HOST, thread_name_prefix="page") as executor:
+            while len(crawl.requests) < self.MAX_FEED_REQUESTS:
+                wave = min(self.MAX_CONNECTIONS_PER_HOST, self.MAX_FEED_REQUESTS - len(crawl.requests))
+                urls = [self._build_rss_url(target, page=number) for number in range(page, page + wave)]
+                for batch in executor.map(lambda url: self._fetch_request(crawl, url, target, now), urls):
+                    yield from batch
+                page += wave
+                if not all(self._is_capped(crawl, url) for url in urls):
+                    return
+
+        logger.warning(f"Stopped after {len(crawl.requests)} requests, feed for {target.comune.title()} may be incomplete")
+        crawl.complete = False
+
+    def _price_bands(self) -> list[tuple[int, int]]:
+        """Split the budget range into one price band per connection"""
+        step = self.max_budget / self.MAX_CONNECTIONS_PER_HOST
+        return [
+            (int(i * step), int((i + 1) * step))
+            for i in range(self.MAX_CONNECTIONS_PER_HOST)
+        ]
+
+    def _split_band(self, crawl: FeedCrawl, url: str, band: tuple[int, int], target: FeedTarget) -> list[tuple[int, int]]:
+        """Halve a price band whose response is still truncated, if it is wide enough"""
+        if not self._is_capped(crawl, url):
+            return []
+        low, high = band
+        if high - low <= self.MIN_PRICE_BAND:
+            logger.warning(f"Price band {low}-{high} in {target.comune.title()} is still truncated")
+            crawl.complete = False
+            return []
+        middle = (low + high) // 2
+        return [(low, middle), (middle, high)]
+
+    def _iter_price_bands(self, crawl: FeedCrawl, target: FeedTarget, now: datetime, bands: list[tuple[int, int]]) -> Iterator[Auction]:
+        """Fetch price bands concurrently, splitting again any band that is still truncated"""
+        with ThreadPoolExecutor(max_workers=self.MAX_CONNECTIONS_PER_HOST, thread_name_prefix="band") as executor:
+            while bands and len(crawl.requests) < self.MAX_FEED_REQUESTS:
+                wave = bands[:self.MAX_FEED_REQUESTS - len(crawl.requests)][:self.MAX_CONNECTIONS_PER_HOST]
+                bands = bands[len(wave):]
+                urls = [self._build_rss_url(target, price_band=band) for band in wave]
+                for band, url, batch in zip(wave, urls, executor.map(lambda url: self._fetch_request(crawl, url, target, now), urls)):
+                    yield from batch
+                    bands.extend(self._split_band(crawl, url, band, target))
+
+        if bands:
+            logger.warning(f"Stopped after {len(crawl.requests)} requests, feed for {target.comune.title()} may be incomplete")
+            crawl.complete = False
+
+    def _iter_request(self, crawl: FeedCrawl, url: str, target: FeedTarget, now: datetime) -> Iterator[Auction]:
+        """Fetch and parse one request of a feed, yielding auctions that match the filters"""
         logger.info(f"Fetching RSS feed: {url}")
-        
+
         try:
-            response = self.session.get(url, timeout=30)
+            with self.metrics.stage("fetch"):
+                response = self.session.get(url, timeout=30, stream=True, headers=crawl.conditional_headers(url))
+            self.metrics.record_retries(response)
             response.raise_for_status()
         except requests.RequestException as e:
+            self.metrics.incr("feed_failures")
             logger.error(f"Error fetching RSS feed: {e}")
-            return []
+            crawl.complete = False
+            return
 
-        try:
-            root = ET.fromstring(response.content)
-        except ET.ParseError as e:
-            logger.error(f"Error parsing RSS feed: {e}")
-            return []
+        if response.status_code == 304:
+            response.close()
+            self.metrics.incr("feeds_not_modified")
+            record = crawl.saved_requests[url]
+            saved = [(key, crawl.previous[key]) for key in record["keys"] if key in crawl.previous]
+            logger.info(f"RSS feed not modified, reusing {len(saved)} saved listings")
+            crawl.requests[url] = record
+            matched = []
+            for key, seen in saved:
+                crawl.current[key] = seen
+                if crawl.claim(key) and self._passes_filters(seen.auction, now):
+                    matched.append(seen.auction)
+            self.metrics.record("filter", items_in=len(saved), items_out=len(matched))
+            yield from matched
+            return
 
-        items = root.findall(".//item")
-        logger.info(f"Found {len(items)} total listings")
-        
-        now = datetime.now()
-        
-        for item in items:
-            auction = self._parse_rss_item(item)
-            if auction is None:
-                continue
-            
-            # Apply budget filter
-            if auction.base_price > self.max_budget:
-                continue
-            
-            # Apply date filters
-            if auction.auction_date is None:
-                if not self.include_undated:
-                    logger.debug(f"Skipping auction with unknown date: {auction.address}")
-                    continue
+        self.metrics.incr("feeds_downloaded")
+        keys: list[str] = []
+        total = parsed = unchanged = matched = 0
+        parse_seconds = filter_seconds = 0.0
+        complete = False
+
+        with response:
+            try:
+                for item in self._iter_feed_items(response):
+                    total += 1
+                    start = time.perf_counter()
+                    texts = self._item_texts(item)
+                    if texts is None:
+                        continue
+                    key, content_hash = self._item_fingerprint(*texts)
+                    seen = crawl.previous.get(key)
+                    if seen is not None and seen.content_hash == content_hash:
+                        # Unchanged since the last run: reuse the parsed and geocoded auction
+                        auction = seen.auction
+                        unchanged += 1
+                        is_new = False
+                    else:
+                        auction = self.parser.parse(*texts)
+                        parse_seconds += time.perf_counter() - start
+                        if auction is None:
+                            continue
+                        auction.city = target.comune
+                        parsed += 1
+                        is_new = True
+                    keys.append(key)
+                    crawl.current[key] = SeenItem(content_hash, auction)
+                    # Pages and price bands can overlap: handle each listing once
+                    if not crawl.claim(key):
+                        continue
+
+                    start = time.perf_counter()
+                    passes = self._passes_filters(auction, now)
+                    filter_seconds += time.perf_counter() - start
+                    if not passes:
+                        continue
+                    matched += 1
+                    if is_new:
+                        (self.changes.changed if seen is not None else self.changes.added).append(auction)
+                    yield auction
+                complete = True
+            except requests.RequestException as e:
+                self.metrics.incr("feed_failures")
+                logger.error(f"Error reading RSS feed: {e}")
+            except ET.ParseError as e:
+                self.metrics.incr("feed_failures")
+                logger.error(f"Error parsing RSS feed: {e}")
+
+        self.metrics.record("xml_parse", items_out=total)
+        self.metrics.record("item_parse", parse_seconds, items_in=total - unchanged, items_out=parsed)
+        self.metrics.record("filter", filter_seconds, items_in=parsed + unchanged, items_out=matched)
+        self.metrics.incr("items_unchanged", unchanged)
+
+        if complete:
+            crawl.requests[url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "count": total,
+                "keys": keys,
+            }
+        else:
+            crawl.complete = False
+
+    def iter_results(self) -> Iterator[Auction]:
+        """Stream geocoded auctions from all targets as they become ready (fetch → parse → filter → geocode)"""
+        for _, auction in self._iter_ordered_results():
+            yield auction
+
+    def _iter_ordered_results(self) -> Iterator[tuple[tuple[int, int], Auction]]:
+        """Stream geocoded auctions in completion order, each with its (target index, feed position)"""
+        # Long-running processes poll repeatedly: keep the date window relative to this run
+        self.cutoff_date = datetime.now() + timedelta(days=self.months_ahead * 30)
+        self.changes = FeedChanges()
+        ready: queue.Queue[Optional[tuple[tuple[int, int], Auction]]] = queue.Queue()
+        # A listing in several overlapping feeds belongs to the first target listing it, so each
+        # feed publishes its keys once parsed and later feeds hold back listings until then
+        parsed = [threading.Event() for _ in self.targets]
+        feed_keys: list[set[str]] = [set() for _ in self.targets]
+        lock = threading.Lock()
+        expected = 0
+
+        def on_zone(future: Future[str], order: tuple[int, int], auction: Auction) -> None:
+            try:
+                if future.cancelled():
+                    return
+                auction.zone = future.result()
+                self.metrics.record("geocode", items_in=1, items_out=1 if auction.zone else 0)
+            finally:
+                ready.put((order, auction))
+
+        def claimed_earlier(index: int, auction: Auction) -> bool:
+            key = auction.reference or auction.url
+            return any(key in feed_keys[earlier] for earlier in range(index))
+
+        def emit(order: tuple[int, int], auction: Auction) -> None:
+            nonlocal expected
+            with lock:
+                expected += 1
+            # Auctions reused from the seen-items store already carry their zone
+            if auction.zone:
+                ready.put((order, auction))
             else:
-                if auction.auction_date < now:
-                    logger.debug(f"Skipping past auction: {auction.address}")
-                    continue
-                if auction.auction_date > self.cutoff_date:
-                    logger.debug(f"Skipping auction beyond cutoff: {auction.address}")
+                self._detect_zone(auction).add_done_callback(lambda future, order=order, auction=auction: on_zone(future, order, auction))
+
+        def produce(index: int, target: FeedTarget) -> None:
+            held: list[tuple[tuple[int, int], Auction]] = []
+            try:
+                for position, auction in enumerate(self.iter_auctions(target)):
+                    feed_keys[index].add(auction.reference or auction.url)
+                    if all(parsed[earlier].is_set() for earlier in range(index)):
+                        if not claimed_earlier(index, auction):
+                            emit((index, position), auction)
+                    else:
+                        held.append(((index, position), auction))
+            finally:
+                parsed[index].set()
+                try:
+                    for earlier in range(index):
+                        parsed[earlier].wait()
+                    for order, auction in held:
+                        if not claimed_earlier(index, auction):
+                            emit(order, auction)
+                finally:
+                    ready.put(None)
+
+        with ThreadPoolExecutor(max_workers=len(self.targets), thread_name_prefix="feed") as executor:
+            feeds = [executor.submit(produce, index, target) for index, target in enumerate(self.targets)]
+            finished = received = 0
+            geocode_wait = 0.0
+            while finished < len(feeds) or received < expected:
+                start = time.perf_counter()
+                item = ready.get()
+                if finished == len(feeds):
+                    # Feeds are done: anything still pending is waiting on geocoding
+                    geocode_wait += time.perf_counter() - start
+                if item is None:
+                    finished += 1
                     continue
-            
-            all_auctions.append(auction)
-        
-        all_auctions.sort(key=lambda a: a.auction_date or datetime.max)
+                received += 1
+                yield item
+            for feed in feeds:
+                feed.result()
+        self.metrics.record("geocode", geocode_wait)
+
+        if self.feed_state:
+            self.feed_state.save()
+
+    def scrape(self) -> list[Auction]:
+        """Scrape auction listings from the RSS feeds of all targets concurrently"""
+        logger.info(f"Scraping apartments in {self._targets_label()}")
+        logger.info(f"Max budget: €{self.max_budget:,.2f}")
+        logger.info(f"Auction date range: now to {self.cutoff_date.strftime('%d/%m/%Y')}")
+
+        # Geocoding finishes in any order: auctions on the same date keep target and feed order
+        results = sorted(self._iter_ordered_results(), key=lambda item: (item[1].auction_date or datetime.max, item[0]))
+        all_auctions = [auction for _, auction in results]
 
         logger.info(f"Found {len(all_auctions)} auctions matching criteria")
 
-        if all_auctions:
-            logger.info("Detecting zones via geocoding...")
-            for auction in all_auctions:
-                zone = self._detect_zone(auction.address)
-                auction.zone = zone
-        
         return all_auctions
+
+    def select_profiles(self, auctions: list[Auction]) -> dict[str, Union[AuctionTable, list[Auction]]]:
+        """Select the auctions of every filter profile from one scrape"""
+        # Columnar filtering when numpy is available, plain lists otherwise
+        dataset = AuctionTable(auctions) if importlib.util.find_spec("numpy") is not None else auctions
+        now = datetime.now()
+        return {profile.name: profile.apply(dataset, now) for profile in self.profiles}
+
+    def _targets_label(self) -> str:
+        """Human-readable list of the comuni being scraped"""
+        return ", ".join(target.comune.title() for target in self.targets)
+
+    def close(self) -> None:
+        """Release background workers and network resources"""
+        self.geocoder.close()
+        self.session.close()
     
     def print_results(self, auctions: list[Auction]) -> None:
         """Print auction results"""
         logger.info("=" * 60)
-        logger.info(f"RESULTS: {len(auctions)} apartments in {self.city.title()}")
+        logger.info(f"RESULTS: {len(auctions)} apartments in {self._targets_label()}")
         logger.info(f"Budget: up to €{self.max_budget:,.2f}")
         logger.info(f"Auctions within next {self.months_ahead} months")
         logger.info("=" * 60)
@@ -360,26 +2048,182 @@ class AstaLegaleScraper:
             logger.info(f"    Ref: {auction.reference}")
             logger.info(f"    URL: {auction.url}")
     
-    def save_results(self, auctions: list[Auction], filename: str = "auctions_torino.csv") -> None:
-        """Save results to CSV file"""
-        with open(filename, "w", encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["address", "zone", "property_type", "auction_date", "base_price", "tribunal", "reference", "url", "description"])
-            
-            for a in auctions:
-                writer.writerow([
-                    a.address,
-                    a.zone,
-                    a.property_type,
-                    a.auction_date.strftime("%d/%m/%Y") if a.auction_date else "",
-                    a.base_price,
-                    a.tribunal,
-                    a.reference,
-                    a.url,
-                    a.description,
-                ])
-        
-        logger.info(f"Results saved to {filename}")
+    def save_results(self, auctions: Iterable[Auction], filename: str = "auctions_torino.csv", output_format: str = "csv") -> None:
+        """Save results to a CSV (default), JSON Lines or Parquet file, or to standard output for '-'"""
+        with open_sink(output_format, filename, metrics=self.metrics) as sink:
+            for auction in auctions:
+                sink.write(auction)
+
+        logger.info(f"Results saved to {'standard output' if filename == '-' else filename}")
+
+
+class AuctionIndex:
+    """Immutable in-memory snapshot of auctions indexed by price, date, zone and tribunal"""
+
+    def __init__(self, auctions: list[Auction]):
+        # Positions follow result order (by date, undated last), so any subset sorts back cheaply
+        self.auctions = sorted(auctions, key=lambda a: a.auction_date or datetime.max)
+        self.records = [_json_record(auction) for auction in self.auctions]
+        self.updated = datetime.now()
+        by_price = sorted(range(len(self.auctions)), key=lambda i: self.auctions[i].base_price)
+        self._price_order = by_price
+        self._prices = [self.auctions[i].base_price for i in by_price]
+        self._dates = [a.auction_date for a in self.auctions]
+        # Dated auctions come first in position order: bisect on their dates
+        self._dated = sum(1 for date in self._dates if date is not None)
+        self._zones: dict[str, set[int]] = {}
+        self._tribunals: dict[str, set[int]] = {}
+        for i, auction in enumerate(self.auctions):
+            if auction.zone:
+                self._zones.setdefault(auction.zone.lower(), set()).add(i)
+            if auction.tribunal:
+                self._tribunals.setdefault(self._tribunal_key(auction.tribunal), set()).add(i)
+
+    @staticmethod
+    def _tribunal_key(tribunal: str) -> str:
+        """Match 'Tribunale di Torino' and 'Torino' alike"""
+        return tribunal.lower().removeprefix("tribunale di ").strip()
+
+    def query(
+        self,
+        max_budget: Optional[float] = None,
+        months: Optional[int] = None,
+        zone: Optional[str] = None,
+        tribunal: Optional[str] = None,
+        include_undated: bool = False,
+    ) -> list[int]:
+        """Positions of matching auctions, in date order"""
+        candidates: Optional[set[int]] = None
+        if zone is not None:
+            candidates = self._zones.get(zone.lower(), set())
+        if tribunal is not None:
+            matches = self._tribunals.get(self._tribunal_key(tribunal), set())
+            candidates = matches if candidates is None else candidates & matches
+        if max_budget is not None:
+            cheap = self._price_order[:bisect.bisect_right(self._prices, max_budget)]
+            candidates = set(cheap) if candidates is None else candidates.intersection(cheap)
+        if months is not None:
+            now = datetime.now()
+            first = bisect.bisect_left(self._dates, now, hi=self._dated)
+            last = bisect.bisect_right(self._dates, now + timedelta(days=months * 30), lo=first, hi=self._dated)
+            window = range(first, last)
+            if include_undated:
+                window = [*window, *range(self._dated, len(self._dates))]
+            candidates = set(window) if candidates is None else candidates.intersection(window)
+        if candidates is None:
+            return list(range(len(self.auctions)))
+        return sorted(candidates)
+
+
+class AuctionQueryServer(ThreadingHTTPServer):
+    """HTTP server answering auction queries from the latest in-memory index"""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int]):
+        super().__init__(address, _AuctionQueryHandler)
+        self.index = AuctionIndex([])
+
+    def update(self, auctions: list[Auction]) -> None:
+        """Swap in a new snapshot; queries in flight keep the one they started with"""
+        self.index = AuctionIndex(auctions)
+        logger.info(f"Query index updated with {len(self.index.auctions)} auctions")
+
+
+class _AuctionQueryHandler(BaseHTTPRequestHandler):
+    """GET /auctions?max_budget=&months=&zone=&tribunal=&include_undated="""
+
+    server: AuctionQueryServer
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        if url.path not in ("/", "/auctions"):
+            self._send_json(404, {"error": f"Unknown path: {url.path}"})
+            return
+
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            max_budget = float(params["max_budget"]) if params.get("max_budget") else None
+            months = int(params["months"]) if params.get("months") else None
+        except ValueError as e:
+            self._send_json(400, {"error": f"Invalid parameter: {e}"})
+            return
+
+        index = self.server.index
+        positions = index.query(
+            max_budget=max_budget,
+            months=months,
+            zone=params.get("zone") or None,
+            tribunal=params.get("tribunal") or None,
+            include_undated=params.get("include_undated", "").lower() in ("1", "true", "yes"),
+        )
+        self._send_json(200, {
+            "updated": index.updated.isoformat(timespec="seconds"),
+            "count": len(positions),
+            "auctions": [index.records[i] for i in positions],
+        })
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+def run_daemon(
+    scraper: AstaLegaleScraper,
+    sink: AuctionSink,
+    interval: float,
+    jitter: float = 0.0,
+    stop: Optional[threading.Event] = None,
+    on_poll: Optional[Callable[[FeedChanges, list[Auction]], None]] = None,
+) -> int:
+    """Poll the feeds until stopped, writing only auctions new or changed since the previous poll to the sink"""
+    stop = stop if stop is not None else threading.Event()
+    previous: Optional[dict[str, dict]] = None
+    polls = 0
+
+    while not stop.is_set():
+        start = time.monotonic()
+        polls += 1
+        diff = FeedChanges()
+        try:
+            current: dict[str, dict] = {}
+            auctions: list[Auction] = []
+            for auction in scraper.iter_results():
+                auctions.append(auction)
+                key = auction.reference or auction.url
+                current[key] = data = auction.to_dict()
+                # The first poll has nothing to compare against: emit the full snapshot
+                before = previous.get(key) if previous is not None else None
+                if before == data:
+                    continue
+                (diff.changed if before is not None else diff.added).append(auction)
+                sink.write(auction)
+            if previous is not None:
+                diff.removed = [Auction.from_dict(data) for key, data in previous.items() if key not in current]
+            previous = current
+            scraper.geocoder.flush()
+            logger.info(
+                f"Poll {polls}: {len(current)} matching, {len(diff.added)} added, "
+                f"{len(diff.changed)} changed, {len(diff.removed)} removed "
+                f"({time.monotonic() - start:.2f}s)"
+            )
+            if on_poll:
+                on_poll(diff, auctions)
+        except Exception as e:
+            logger.error(f"Poll {polls} failed: {e}")
+
+        delay = max(0.0, interval - (time.monotonic() - start)) + random.uniform(0, jitter)
+        logger.debug(f"Next poll in {delay:.1f}s")
+        stop.wait(delay)
+
+    return polls
 
 
 def main():
@@ -387,8 +2231,28 @@ def main():
     parser = argparse.ArgumentParser(description="Scrape apartment auctions from astalegale.net")
     parser.add_argument("--budget", type=float, default=150000, help="Maximum budget in EUR (default: 150000)")
     parser.add_argument("--city", type=str, default="torino", help="City to search (default: torino)")
+    parser.add_argument("--target", type=str, action="append", metavar="REGION/PROVINCE/COMUNE", help="Feed to scrape, e.g. piemonte/to/moncalieri; repeat to scrape several concurrently (overrides --city)")
     parser.add_argument("--months", type=int, default=3, help="Months ahead to search (default: 3)")
-    parser.add_argument("--output", type=str, default="auctions_torino.csv", help="Output CSV file (default: auctions_torino.csv)")
+    parser.add_argument("--profile", type=str, action="append", metavar="NAME:BUDGET[:MONTHS[:undated]]", help="Filter profile served by the same scrape, written to <output>_NAME; repeat for several (overrides --budget, --months and --include-undated)")
+    parser.add_argument("--output", type=str, help="Output file, or - for standard output (default: auctions_torino.<format>)")
+    parser.add_argument("--format", type=str, choices=["csv", "jsonl", "parquet"], default="csv", help="Output format; parquet requires pyarrow (default: csv)")
+    parser.add_argument("--feed-item-cap", type=int, default=0, help=f"Item count at which a feed response is treated as truncated and completed via pages or price bands, e.g. {AstaLegaleScraper.FEED_ITEM_CAP}; 0 disables (default: 0)")
+    parser.add_argument("--geocode-cache", type=str, default=".geocode_cache.json", help="Geocode cache file; use a .sqlite/.db extension for the SQLite backend (default: .geocode_cache.json)")
+    parser.add_argument("--geocoder", type=str, choices=list(GEOCODER_BACKENDS), default="nominatim", help="Geocoding backend; offline uses only the cache, gazetteer and zones file (default: nominatim)")
+    parser.add_argument("--geocoder-url", type=str, help="Backend endpoint, e.g. a self-hosted Nominatim /search or Photon /api (default: public Nominatim, or localhost:2322 for photon)")
+    parser.add_argument("--geocoder-rate", type=float, help="Backend requests per second (default: 1 for public Nominatim, unlimited otherwise)")
+    parser.add_argument("--geocoder-workers", type=int, help="Concurrent backend requests (default: 2 for public Nominatim, 16 otherwise)")
+    parser.add_argument("--gazetteer-confidence", type=float, default=StreetGazetteer.MIN_CONFIDENCE, help=f"Share of a street's cached addresses (at least {StreetGazetteer.MIN_OBSERVATIONS}) that must agree on a zone to resolve it without Nominatim; above 1 disables (default: {StreetGazetteer.MIN_CONFIDENCE})")
+    parser.add_argument("--zones-geojson", type=str, help="GeoJSON file of neighborhood polygons used to resolve zones offline from geocoded coordinates")
+    parser.add_argument("--feed-state", type=str, default=".feed_state.json", help="File storing feed validators for conditional requests (default: .feed_state.json)")
+    parser.add_argument("--changes", type=str, help="Write auctions added, changed or removed since the last run to this JSON file")
+    parser.add_argument("--metrics-json", type=str, help="Write a JSON run report with per-stage timings and counters to this file")
+    parser.add_argument("--metrics-prom", type=str, help="Write run metrics in Prometheus text format to this file")
+    parser.add_argument("--stream", action="store_true", help="Write each auction as soon as it is geocoded, in arrival order instead of sorted by date")
+    parser.add_argument("--daemon", action="store_true", help="Keep running and poll the feeds every --interval seconds, writing only new or changed auctions")
+    parser.add_argument("--interval", type=float, default=300, help="Seconds between polls in daemon mode (default: 300)")
+    parser.add_argument("--jitter", type=float, default=30, help="Maximum random delay in seconds added to each poll interval (default: 30)")
+    parser.add_argument("--serve", type=int, metavar="PORT", help="After scraping, keep serving JSON queries on http://127.0.0.1:PORT/auctions (refreshed on every poll with --daemon)")
     parser.add_argument("--include-undated", action="store_true", help="Include auctions without scheduled date")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
 
@@ -397,23 +2261,150 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    if args.format == "parquet" and importlib.util.find_spec("pyarrow") is None:
+        logger.error("Parquet output requires pyarrow: pip install pyarrow")
+        return 1
+    if args.format == "parquet" and args.output == "-":
+        logger.error("Parquet output cannot be written to standard output")
+        return 1
+    if args.daemon and args.format == "parquet":
+        logger.error("Daemon mode writes incrementally: use --format csv or jsonl")
+        return 1
+    if args.daemon and (args.interval <= 0 or args.jitter < 0):
+        logger.error("Invalid arguments: --interval must be positive and --jitter non-negative")
+        return 1
+    output = args.output or f"auctions_torino.{args.format}"
+
+    metrics = ScrapeMetrics()
+
+    try:
+        zone_index = ZoneIndex.from_geojson(args.zones_geojson) if args.zones_geojson else None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.error(f"Cannot load zones from {args.zones_geojson}: {e}")
+        return 1
+
+    try:
+        backend = open_geocoder_backend(args.geocoder, args.geocoder_url, args.geocoder_rate, args.geocoder_workers)
+    except ValueError as e:
+        logger.error(f"Invalid arguments: {e}")
+        return 1
+
+    geocode_cache = open_geocode_cache(args.geocode_cache)
+    gazetteer = StreetGazetteer(geocode_cache, args.gazetteer_confidence) if args.gazetteer_confidence <= 1 else None
+
     try:
+        targets = [FeedTarget.parse(spec) for spec in args.target or []]
+        profiles = [FilterProfile.parse(spec) for spec in args.profile or []]
+        if len({profile.name for profile in profiles}) != len(profiles):
+            raise ValueError("Profile names must be unique")
+        if profiles and (args.stream or args.daemon):
+            raise ValueError("Profiles write one file each after the scrape and cannot be combined with --stream or --daemon")
+        if profiles and output == "-":
+            raise ValueError("Profiles write one file each and cannot use --output -")
         scraper = AstaLegaleScraper(
             max_budget=args.budget,
             city=args.city,
             months_ahead=args.months,
             include_undated=args.include_undated,
+            geocoder=GeocodingService(cache=geocode_cache, metrics=metrics, zone_index=zone_index, gazetteer=gazetteer, backend=backend),
+            feed_state=FeedStateStore(args.feed_state),
+            targets=targets,
+            metrics=metrics,
+            feed_item_cap=args.feed_item_cap,
+            profiles=profiles,
         )
     except ValueError as e:
         logger.error(f"Invalid arguments: {e}")
         return 1
 
-    auctions = scraper.scrape()
-    scraper.print_results(auctions)
+    server: Optional[AuctionQueryServer] = None
+    if args.serve is not None:
+        try:
+            server = AuctionQueryServer(("127.0.0.1", args.serve))
+        except OSError as e:
+            logger.error(f"Cannot serve on port {args.serve}: {e}")
+            scraper.close()
+            return 1
+        threading.Thread(target=server.serve_forever, name="http", daemon=True).start()
+        logger.info(f"Serving auction queries on http://127.0.0.1:{server.server_port}/auctions")
+
+    stop = threading.Event()
+
+    def stop_on_sigterm() -> None:
+        # Only the long-running modes finish their poll or request on SIGTERM;
+        # one-shot and streaming runs keep the default, immediate termination
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
 
-    if auctions:
-        scraper.save_results(auctions, args.output)
+    def write_reports(changes: FeedChanges, auctions: list[Auction]) -> None:
+        if server:
+            server.update(auctions)
+        if args.changes:
+            Path(args.changes).write_text(json.dumps(changes.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        if args.metrics_json:
+            Path(args.metrics_json).write_text(json.dumps(metrics.to_dict(), indent=2), encoding="utf-8")
+        if args.metrics_prom:
+            Path(args.metrics_prom).write_text(metrics.to_prometheus(), encoding="utf-8")
+
+    if args.daemon:
+        logger.info(f"Polling {scraper._targets_label()} every {args.interval:g}s (+ up to {args.jitter:g}s jitter)")
+        stop_on_sigterm()
+        try:
+            with open_sink(args.format, output, metrics=metrics, streaming=True) as sink:
+                run_daemon(scraper, sink, args.interval, args.jitter, stop=stop, on_poll=write_reports)
+        except KeyboardInterrupt:
+            logger.info("Interrupted, shutting down")
+        finally:
+            scraper.close()
+            if server:
+                server.shutdown()
+        return 0
 
+    try:
+        if args.stream:
+            auctions = []
+            with open_sink(args.format, output, metrics=metrics, streaming=True) as sink:
+                for auction in scraper.iter_results():
+                    sink.write(auction)
+                    # Only the query server needs the full set: keep streaming runs constant-memory otherwise
+                    if server:
+                        auctions.append(auction)
+            logger.info(f"Streamed {sink.count} auctions to {'standard output' if output == '-' else output}")
+        elif profiles:
+            auctions = scraper.scrape()
+            selections = scraper.select_profiles(auctions)
+            for profile in profiles:
+                selected = selections[profile.name]
+                logger.info(f"Profile {profile.name}: {len(selected)} auctions up to €{profile.max_budget:,.2f} within {profile.months_ahead} months")
+                if selected:
+                    path = Path(output)
+                    scraper.save_results(selected, str(path.with_name(f"{path.stem}_{profile.name}{path.suffix}")), args.format)
+        else:
+            auctions = scraper.scrape()
+            scraper.print_results(auctions)
+            if auctions:
+                scraper.save_results(auctions, output, args.format)
+
+        changes = scraper.changes
+        logger.info(
+            f"Changes since last run: {len(changes.added)} added, "
+            f"{len(changes.changed)} changed, {len(changes.removed)} removed"
+        )
+        logger.info(
+            f"Geocoding: {metrics.counters.get('geocode_requests', 0)} requests, "
+            f"{metrics.counters.get('geocode_requests_saved', 0)} saved by address normalization"
+        )
+    finally:
+        scraper.close()
+
+    write_reports(changes, auctions)
+
+    if server:
+        stop_on_sigterm()
+        try:
+            stop.wait()
+        except KeyboardInterrupt:
+            logger.info("Interrupted, shutting down")
+        server.shutdown()
     return 0
 
 
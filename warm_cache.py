@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Geocode cache warm-up for auction_scraper.
+Reads historical result CSVs (or JSON Lines, or plain address lists), dedupes
+the addresses by normalized street and geocodes the ones not cached yet at the
+allowed rate, so later scrapes start with a warm cache.
+
+Progress is checkpointed: an interrupted run resumes where it stopped.
+"""
+
+import argparse
+import csv
+import json
+import logging
+from pathlib import Path
+from typing import Iterator
+
+from scraper import (
+    AddressNormalizer,
+    GEOCODER_BACKENDS,
+    GeocodingService,
+    ScrapeMetrics,
+    StreetGazetteer,
+    _atomic_write_text,
+    open_geocode_cache,
+    open_geocoder_backend,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def read_addresses(path: Path, default_city: str) -> Iterator[tuple[str, str]]:
+    """Yield (address, city) pairs from a results CSV, a JSON Lines file or a text file with one address per line"""
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.suffix == ".csv":
+            for row in csv.DictReader(f):
+                if row.get("address"):
+                    yield row["address"], row.get("city") or default_city
+        elif path.suffix in (".jsonl", ".ndjson"):
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    if record.get("address"):
+                        yield record["address"], record.get("city") or default_city
+        else:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    yield line, default_city
+
+
+def load_checkpoint(path: Path) -> set[str]:
+    """Street keys already processed by an earlier, interrupted run"""
+    if not path.exists():
+        return set()
+    try:
+        return set(json.loads(path.read_text(encoding="utf-8")).get("done", []))
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+        return set()
+
+
+def save_checkpoint(path: Path, done: set[str]) -> None:
+    """Record the processed street keys atomically"""
+    _atomic_write_text(path, json.dumps({"done": sorted(done)}, ensure_ascii=False))
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Pre-populate the geocode cache from historical results or address lists")
+    parser.add_argument("inputs", nargs="+", help="Results CSV/JSON Lines files or text files with one address per line")
+    parser.add_argument("--city", type=str, default="torino", help="City for inputs without a city column (default: torino)")
+    parser.add_argument("--geocode-cache", type=str, default=".geocode_cache.json", help="Geocode cache file to fill; use a .sqlite/.db extension for the SQLite backend (default: .geocode_cache.json)")
+    parser.add_argument("--geocoder", type=str, choices=[name for name in GEOCODER_BACKENDS if name != "offline"], default="nominatim", help="Geocoding backend (default: nominatim)")
+    parser.add_argument("--geocoder-url", type=str, help="Backend endpoint, e.g. a self-hosted Nominatim /search or Photon /api (default: public Nominatim, or localhost:2322 for photon)")
+    parser.add_argument("--geocoder-rate", type=float, help="Backend requests per second (default: 1 for public Nominatim, unlimited otherwise)")
+    parser.add_argument("--geocoder-workers", type=int, help="Concurrent backend requests (default: 2 for public Nominatim, 16 otherwise)")
+    parser.add_argument("--checkpoint", type=str, default=".warm_cache_checkpoint.json", help="Progress file used to resume an interrupted run (default: .warm_cache_checkpoint.json)")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and consider every address again")
+    parser.add_argument("--batch", type=int, default=50, help="Addresses geocoded between checkpoints; raise it for fast self-hosted backends (default: 50)")
+    parser.add_argument("--metrics-json", type=str, help="Write a JSON report with geocoding timings and counters to this file")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    if args.batch <= 0:
+        logger.error("Invalid arguments: --batch must be positive")
+        return 1
+
+    normalizer = AddressNormalizer()
+    unique: dict[str, tuple[str, str]] = {}
+    total = 0
+    try:
+        for name in args.inputs:
+            for address, city in read_addresses(Path(name), args.city.lower()):
+                total += 1
+                unique.setdefault(f"{normalizer.street_key(address)}|{city.lower()}", (address, city.lower()))
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        logger.error(f"Cannot read addresses: {e}")
+        return 1
+
+    checkpoint = Path(args.checkpoint)
+    done = set() if args.restart else load_checkpoint(checkpoint)
+    pending = [(key, address, city) for key, (address, city) in unique.items() if key not in done]
+    logger.info(f"{total} addresses, {len(unique)} distinct streets, {len(unique) - len(pending)} already done, {len(pending)} to geocode")
+
+    metrics = ScrapeMetrics()
+    cache = open_geocode_cache(args.geocode_cache)
+    backend = open_geocoder_backend(args.geocoder, args.geocoder_url, args.geocoder_rate, args.geocoder_workers)
+    geocoder = GeocodingService(cache=cache, metrics=metrics, gazetteer=StreetGazetteer(cache), backend=backend)
+    resolved = 0
+    try:
+        for start in range(0, len(pending), args.batch):
+            batch = pending[start:start + args.batch]
+            failures = metrics.counters.get("geocode_failures", 0)
+            futures = [geocoder.submit(address, city) for _, address, city in batch]
+            zones = [future.result() for future in futures]
+            # Failed requests are not cached: leave them for the next run unless the whole batch succeeded
+            batch_failed = metrics.counters.get("geocode_failures", 0) > failures
+            for (key, _, _), zone in zip(batch, zones):
+                if zone or not batch_failed:
+                    done.add(key)
+            resolved += sum(1 for zone in zones if zone)
+            geocoder.flush()
+            save_checkpoint(checkpoint, done)
+            logger.info(f"Geocoded {min(start + args.batch, len(pending))}/{len(pending)} streets ({resolved} with a zone)")
+    except KeyboardInterrupt:
+        logger.info("Interrupted, progress saved: run again to resume")
+        save_checkpoint(checkpoint, done)
+    finally:
+        geocoder.close()
+
+    counters = metrics.counters
+    logger.info(
+        f"Done: {counters.get('geocode_requests', 0)} requests, "
+        f"{counters.get('geocode_cache_hits', 0) + counters.get('geocode_gazetteer_hits', 0)} already known, "
+        f"{counters.get('geocode_failures', 0)} failed"
+    )
+    if args.metrics_json:
+        Path(args.metrics_json).write_text(json.dumps(metrics.to_dict(), indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())